@@ -2,11 +2,12 @@
 """Cross-platform utility functions for architect-agent scripts."""
 
 import json
+import os
 import subprocess
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 
 def atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
@@ -30,12 +31,14 @@ def atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
     shutil.move(str(tmp_path), str(path))
 
 
-def atomic_write_text(path: Path, content: str) -> None:
+def atomic_write_text(path: Path, content: str, mode: int | None = None) -> None:
     """Atomically write text content to a file.
 
     Args:
         path: Target file path
         content: Text content to write
+        mode: Permission bits to apply before the file is moved into place
+            (optional; temp files are created 0o600)
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -46,9 +49,104 @@ def atomic_write_text(path: Path, content: str) -> None:
         tmp.write(content)
         tmp_path = Path(tmp.name)
 
+    if mode is not None:
+        os.chmod(tmp_path, mode)
     shutil.move(str(tmp_path), str(path))
 
 
+def atomic_write_lines(
+    path: Path, lines: Iterable[str], mode: int | None = None
+) -> None:
+    """Atomically write an iterable of text chunks to a file.
+
+    Chunks are streamed into the temp file as they are produced, so callers
+    can write large outputs without first joining them into one string.
+
+    Args:
+        path: Target file path
+        lines: Text chunks to write, each including its own line terminator
+        mode: Permission bits to apply before the file is moved into place
+            (optional; temp files are created 0o600)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(
+        mode="w", dir=path.parent, suffix=".tmp", delete=False
+    ) as tmp:
+        tmp_path = Path(tmp.name)
+        try:
+            tmp.writelines(lines)
+        except BaseException:
+            # WHY: The iterable may raise mid-stream; do not leave a partial temp file
+            tmp.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    if mode is not None:
+        os.chmod(tmp_path, mode)
+    shutil.move(str(tmp_path), str(path))
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Flush directory entry changes (create/rename) to disk where supported."""
+    # WHY: Windows cannot open a directory for fsync; NTFS journals renames itself
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: Path, data: bytes, mode: int | None = None) -> None:
+    """Atomically and durably write pre-encoded bytes to a file.
+
+    The data is written with raw os.write calls (no text-layer buffering or
+    newline translation), fsynced, renamed over the target, and the parent
+    directory is fsynced once so the rename itself survives a crash. The
+    directory fsync is best-effort: the file is already in place by then.
+
+    Args:
+        path: Target file path
+        data: Bytes to write (e.g. output of orjson.dumps)
+        mode: Permission bits to apply before the file is moved into place
+            (optional; temp files are created 0o600)
+    """
+    path = Path(path)
+
+    # WHY: The parent usually exists already; creating it only when the temp
+    # file cannot be opened saves a mkdir/stat round trip on the common path
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        try:
+            view = memoryview(data)
+            # WHY: os.write may return short counts; only reissue for the remainder
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    # WHY: Some filesystems (e.g. NFS/SMB mounts) reject fsync on a directory;
+    # the write has already succeeded, so that must not be reported as failure
+    try:
+        _fsync_dir(path.parent)
+    except OSError:
+        pass
+
+
 def run_command(
     cmd: list[str], cwd: Path | None = None, timeout: float | None = None
 ) -> tuple[int, str, str]:
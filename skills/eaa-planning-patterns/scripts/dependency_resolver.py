@@ -11,15 +11,66 @@ WHEN: Use whenever you need to determine execution order from dependency graphs.
 """
 
 import argparse
+import heapq
 import json
+import logging
 import sys
 from collections import defaultdict, deque
 from pathlib import Path
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 SKILLS_DIR = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(SKILLS_DIR / "shared"))
-from cross_platform import atomic_write_text  # type: ignore  # noqa: E402
+from cross_platform import (  # type: ignore  # noqa: E402
+    atomic_write_bytes,
+    atomic_write_lines,
+)
+
+# WHY: orjson parses and serializes in C, several times faster than stdlib json
+#      on large graphs; fall back to the stdlib when it is not installed.
+#      orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+#      keep catching the stdlib exception type.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads(content: str) -> Any:
+    """Parse JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # WHY: ensure_ascii=False matches orjson's raw UTF-8, so the output bytes do
+    #      not depend on whether orjson is installed
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# WHY: Verbose diagnostics go through a logger so messages are only formatted
+#      when DEBUG is enabled; %-style arguments stay unformatted otherwise
+logger = logging.getLogger("dependency_resolver")
+
+
+def _enable_verbose_logging() -> None:
+    """Send DEBUG messages from this module to stderr, unformatted like print()."""
+    logger.setLevel(logging.DEBUG)
+    # WHY: Attach the handler once even when several verbose resolvers are created
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+
+
+# WHY: Shared empty adjacency for nodes with no dependents, so lookups on leaf
+#      nodes never allocate a fresh empty list
+_EMPTY: tuple = ()
 
 
 class DependencyResolver:
@@ -30,6 +81,19 @@ class DependencyResolver:
          Allows reusable analysis (cycles, subgraphs) without reloading data.
     """
 
+    # WHY: Fixed attribute set; slots drop the per-instance __dict__ and make
+    #      the hot self.graph / cache lookups slot reads. reverse_graph is a
+    #      property backed by _reverse_graph
+    __slots__ = (
+        "verbose",
+        "nodes",
+        "graph",
+        "_reverse_graph",
+        "_topo_cache",
+        "_cycles_cache",
+        "_subgraph_cache",
+    )
+
     def __init__(self, verbose: bool = False):
         """
         Initialize resolver.
@@ -37,9 +101,20 @@ class DependencyResolver:
         WHY: Verbose mode helps debug complex dependency chains and circular dependencies.
         """
         self.verbose = verbose
+        if verbose:
+            _enable_verbose_logging()
         self.nodes: Dict[str, Dict[str, Any]] = {}
         self.graph: Dict[str, List[str]] = {}  # node -> list of dependencies
-        self.reverse_graph: Dict[str, List[str]] = {}  # node -> list of dependents
+        # WHY: node -> list of dependents, built on first access by the
+        #      reverse_graph property; cycle detection alone never needs it
+        self._reverse_graph: Optional[Dict[str, List[str]]] = None
+        # WHY: Memoized traversal results; subgraph/filter queries reuse them
+        #      instead of re-running Kahn + cycle DFS. Reset by load_graph().
+        self._topo_cache: Optional[List[str]] = None
+        self._cycles_cache: Optional[List[List[str]]] = None
+        # WHY: Per-node transitive closures; repeated queries for the same target
+        #      (and CLI pipelines asking about many targets) skip the BFS entirely
+        self._subgraph_cache: Dict[str, List[str]] = {}
 
     def load_graph(self, file_path: str) -> None:
         """
@@ -63,24 +138,16 @@ class DependencyResolver:
         # WHY: Read as text first to handle both JSON and YAML with appropriate parser
         content = path.read_text(encoding="utf-8")
 
-        # WHY: Try JSON first as it's more common and faster to parse
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
-            # WHY: Fall back to YAML only if JSON fails, requires yaml module
+        # WHY: Sniff the first non-whitespace character instead of attempting a JSON
+        #      parse on every file; YAML documents then skip the failed JSON pass.
+        #      A "{" can still be YAML flow style, so JSON errors fall back to YAML.
+        if content.lstrip()[:1] in ("{", "["):
             try:
-                import yaml as yaml_module
-
-                data = yaml_module.safe_load(content)
-            except ImportError:
-                raise ValueError(
-                    "YAML file detected but PyYAML not installed. Use JSON format or install PyYAML."
-                ) from None
-            except Exception as e:
-                # WHY: Catch YAML parsing errors after successful import
-                if "yaml" in type(e).__module__.lower():
-                    raise ValueError(f"Invalid YAML format: {e}") from e
-                raise
+                data = _loads(content)
+            except json.JSONDecodeError:
+                data = self._parse_yaml(content)
+        else:
+            data = self._parse_yaml(content)
 
         # WHY: Validate top-level structure before processing
         if not isinstance(data, dict) or "nodes" not in data:
@@ -88,11 +155,18 @@ class DependencyResolver:
                 'Invalid graph format. Expected: {"nodes": {"A": {"deps": [...]}, ...}}'
             )
 
+        # WHY: A new graph invalidates any previously computed order or cycles.
+        #      Reset before touching nodes/graph so a reload that fails validation
+        #      cannot leave results memoized for the previous graph
+        self._topo_cache = None
+        self._cycles_cache = None
+        self._subgraph_cache = {}
+        self._reverse_graph = None
+
         self.nodes = data["nodes"]
 
         # WHY: Build adjacency lists for efficient graph traversal
         self.graph = {}
-        self.reverse_graph = defaultdict(list)
 
         for node_id, node_data in self.nodes.items():
             # WHY: Default to empty deps if not specified, allows nodes with no dependencies
@@ -105,21 +179,62 @@ class DependencyResolver:
 
             self.graph[node_id] = deps
 
-            # WHY: Reverse graph enables finding all nodes that depend on a given node
-            for dep in deps:
-                self.reverse_graph[dep].append(node_id)
-
-        # WHY: Ensure all referenced dependencies actually exist in the graph
-        all_nodes = set(self.graph.keys())
+        # WHY: Ensure all referenced dependencies actually exist in the graph.
+        #      The keys view gives O(1) membership without copying into a set, and
+        #      the set of missing names is only built when there is an error to report
+        all_nodes = self.graph.keys()
         for node_id, deps in self.graph.items():
-            missing = set(deps) - all_nodes
+            missing = [dep for dep in deps if dep not in all_nodes]
             if missing:
                 raise ValueError(
-                    f"Node '{node_id}' references non-existent dependencies: {missing}"
+                    f"Node '{node_id}' references non-existent dependencies: {set(missing)}"
                 )
 
         if self.verbose:
-            print(f"Loaded graph with {len(self.nodes)} nodes", file=sys.stderr)
+            logger.debug("Loaded graph with %d nodes", len(self.nodes))
+
+    @property
+    def reverse_graph(self) -> Dict[str, List[str]]:
+        """
+        Map each node to the list of nodes that depend on it.
+
+        WHY: Reverse graph enables finding all nodes that depend on a given node.
+             Built lazily so callers that only detect cycles or query subgraphs
+             never pay for a second copy of every edge. Leaf nodes are absent;
+             look them up with .get(node, _EMPTY).
+        """
+        if self._reverse_graph is None:
+            reverse: Dict[str, List[str]] = defaultdict(list)
+            for node_id, deps in self.graph.items():
+                for dep in deps:
+                    reverse[dep].append(node_id)
+            self._reverse_graph = dict(reverse)
+        return self._reverse_graph
+
+    @staticmethod
+    def _parse_yaml(content: str) -> Any:
+        """
+        Parse YAML graph content.
+
+        WHY: PyYAML is optional, so it is imported only when a YAML file is loaded.
+             The libyaml-backed CSafeLoader is used when available (much faster
+             than the pure-Python SafeLoader).
+
+        Raises:
+            ValueError: If PyYAML is missing or the content is not valid YAML
+        """
+        try:
+            import yaml as yaml_module
+        except ImportError:
+            raise ValueError(
+                "YAML file detected but PyYAML not installed. Use JSON format or install PyYAML."
+            ) from None
+
+        loader = getattr(yaml_module, "CSafeLoader", yaml_module.SafeLoader)
+        try:
+            return yaml_module.load(content, Loader=loader)
+        except yaml_module.YAMLError as e:
+            raise ValueError(f"Invalid YAML format: {e}") from e
 
     def detect_cycles(self) -> List[List[str]]:
         """
@@ -127,49 +242,65 @@ class DependencyResolver:
 
         WHY: Circular dependencies make topological sort impossible.
              Must detect and report ALL cycles for effective debugging.
-             Uses DFS with path tracking for accurate cycle detection.
+             Uses iterative DFS with path tracking for accurate cycle detection.
 
         Returns:
-            List of cycles, where each cycle is a list of node IDs forming the loop
+            List of cycles, where each cycle is a list of node IDs forming the loop.
+            The list is cached until the next load_graph(); treat it as read-only.
         """
+        if self._cycles_cache is not None:
+            return self._cycles_cache
+
+        # WHY: Without any edges (including the empty graph) no cycle can exist,
+        #      so tiny or flat inputs skip the DFS bookkeeping entirely
+        if not any(self.graph.values()):
+            self._cycles_cache = []
+            return self._cycles_cache
+
         cycles = []
         visited = set()
-        # WHY: Track current path to detect when we revisit a node in the same path
-        rec_stack = set()
+        # WHY: Track current path to detect when we revisit a node in the same path;
+        #      path_index maps each node on the current path to its position, doubling
+        #      as the recursion-stack set and giving O(1) cycle-start lookups
+        path_index: Dict[str, int] = {}
         path = []
 
-        def dfs(node: str) -> None:
-            """
-            WHY: Recursive DFS maintains path state naturally via call stack.
-                 Detects cycles when we encounter a node already in current path.
-            """
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for dep in self.graph.get(node, []):
-                if dep not in visited:
-                    dfs(dep)
-                elif dep in rec_stack:
-                    # WHY: Found cycle - extract the loop from current path
-                    cycle_start = path.index(dep)
-                    cycle = path[cycle_start:] + [dep]
-                    cycles.append(cycle)
-
-            # WHY: Remove from recursion stack when backtracking
-            path.pop()
-            rec_stack.remove(node)
-
         # WHY: Start DFS from all nodes to catch disconnected cycles
-        for node in self.graph:
-            if node not in visited:
-                dfs(node)
+        for root in self.graph:
+            if root in visited:
+                continue
+
+            visited.add(root)
+            path_index[root] = len(path)
+            path.append(root)
+            # WHY: Explicit stack of dependency iterators instead of recursion, so deep
+            #      chains cannot hit the recursion limit and no frame is built per node.
+            #      Each iterator resumes where it left off once its child is finished.
+            stack = [iter(self.graph.get(root, _EMPTY))]
+
+            while stack:
+                for dep in stack[-1]:
+                    if dep not in visited:
+                        visited.add(dep)
+                        path_index[dep] = len(path)
+                        path.append(dep)
+                        stack.append(iter(self.graph.get(dep, _EMPTY)))
+                        break
+                    cycle_start = path_index.get(dep)
+                    if cycle_start is not None:
+                        # WHY: Found cycle - extract the loop from current path
+                        cycles.append(path[cycle_start:] + [dep])
+                else:
+                    # WHY: All deps explored - backtrack out of this node
+                    stack.pop()
+                    del path_index[path.pop()]
 
         if self.verbose and cycles:
-            print(f"Detected {len(cycles)} cycle(s)", file=sys.stderr)
+            logger.debug("Detected %d cycle(s)", len(cycles))
             for i, cycle in enumerate(cycles, 1):
-                print(f"  Cycle {i}: {' -> '.join(cycle)}", file=sys.stderr)
+                logger.debug("  Cycle %d: %s", i, " -> ".join(cycle))
 
+        self._cycles_cache = cycles
         return cycles
 
     def topological_sort(self) -> List[str]:
@@ -177,59 +308,142 @@ class DependencyResolver:
         Perform topological sort using Kahn's algorithm (in-degree BFS).
 
         WHY: Kahn's algorithm is more intuitive than DFS-based approaches.
-             Produces stable ordering: nodes with same depth appear in lexicographic order.
-             Detects cycles naturally when not all nodes can be processed.
+             Produces stable ordering: among all nodes whose dependencies are
+             satisfied, the lexicographically smallest is always emitted next.
+             Detects cycles naturally when not all nodes can be processed; the
+             detailed cycle report is only computed in that case.
 
         Returns:
-            Ordered list of node IDs (dependencies before dependents)
+            Ordered list of node IDs (dependencies before dependents).
+            The list is cached until the next load_graph(); treat it as read-only.
 
         Raises:
             ValueError: If graph contains cycles (no valid topological order exists)
         """
-        # WHY: Check for cycles first to provide detailed cycle information
-        cycles = self.detect_cycles()
-        if cycles:
-            cycle_strs = [" -> ".join(c) for c in cycles]
-            raise ValueError(
-                "Cannot perform topological sort: circular dependencies detected:\n"
-                + "\n".join(f"  - {c}" for c in cycle_strs)
-            )
+        if self._topo_cache is not None:
+            return self._topo_cache
+
+        # WHY: When no node has dependencies (including the empty graph) every node
+        #      is ready at once, so the order is simply sorted node IDs - skip the
+        #      in-degree map, heap, and dependents map for these trivial inputs
+        if not any(self.graph.values()):
+            self._topo_cache = sorted(self.graph)
+            return self._topo_cache
 
         # WHY: Calculate in-degree (number of dependencies) for each node
         in_degree = {node: len(deps) for node, deps in self.graph.items()}
 
         # WHY: Start with nodes that have no dependencies (in-degree = 0)
-        #      Use sorted() for deterministic ordering when multiple nodes have same in-degree
-        queue = deque(
-            sorted([node for node, degree in in_degree.items() if degree == 0])
-        )
+        #      A min-heap as the ready queue always yields the lexicographically
+        #      smallest ready node, so ordering is deterministic without sorting
+        queue = [node for node, degree in in_degree.items() if degree == 0]
+        heapq.heapify(queue)
         result = []
+        # WHY: Bind the hot-loop lookups to locals once; on large graphs the loop
+        #      body runs once per edge and attribute/global lookups dominate
+        reverse_get = self.reverse_graph.get
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        verbose = self.verbose
 
         while queue:
             # WHY: Process nodes in lexicographic order for deterministic results
-            node = queue.popleft()
+            node = heappop(queue)
             result.append(node)
 
-            if self.verbose:
-                print(f"Processing: {node}", file=sys.stderr)
+            # WHY: Local flag check keeps the per-node cost to one branch when quiet
+            if verbose:
+                logger.debug("Processing: %s", node)
 
             # WHY: Decrease in-degree of all dependents (nodes that depend on current node)
-            for dependent in sorted(self.reverse_graph.get(node, [])):
-                in_degree[dependent] -= 1
+            for dependent in reverse_get(node, _EMPTY):
+                remaining = in_degree[dependent] - 1
+                in_degree[dependent] = remaining
 
                 # WHY: When in-degree reaches 0, all dependencies are satisfied
-                if in_degree[dependent] == 0:
-                    queue.append(dependent)
+                if remaining == 0:
+                    heappush(queue, dependent)
 
-        # WHY: Sanity check - if we didn't process all nodes, there's a cycle we missed
+        # WHY: Kahn's algorithm leaves nodes on a cycle unprocessed, so acyclic graphs
+        #      (the common case) never pay for a DFS; only on failure do we run
+        #      detect_cycles() to report exactly which loops exist
         if len(result) != len(self.graph):
-            unprocessed = set(self.graph.keys()) - set(result)
-            raise ValueError(
-                f"Topological sort incomplete. Unprocessed nodes (likely in cycle): {unprocessed}"
-            )
+            self._raise_unsorted(result)
 
+        self._topo_cache = result
         return result
 
+    def topological_layers(self) -> List[List[str]]:
+        """
+        Group nodes into waves that can run in parallel (Kahn's algorithm by rounds).
+
+        WHY: A flat order hides which tasks are independent. Each layer holds the
+             nodes whose dependencies are all in earlier layers, so a scheduler can
+             dispatch a whole layer at once (e.g. pool.map(run, layer)).
+
+        Returns:
+            List of layers in execution order; nodes within a layer are sorted.
+
+        Raises:
+            ValueError: If graph contains cycles (no valid topological order exists)
+        """
+        # WHY: Without edges every node is ready immediately - a single layer
+        if not any(self.graph.values()):
+            return [sorted(self.graph)] if self.graph else []
+
+        in_degree = {node: len(deps) for node, deps in self.graph.items()}
+        reverse_get = self.reverse_graph.get
+
+        layer = sorted(node for node, degree in in_degree.items() if degree == 0)
+        layers: List[List[str]] = []
+        processed = 0
+
+        while layer:
+            layers.append(layer)
+            processed += len(layer)
+
+            if self.verbose:
+                logger.debug("Layer %d: %s", len(layers), " ".join(layer))
+
+            # WHY: Drain the whole ready set per round; dependents that become ready
+            #      form the next layer rather than joining the current one
+            next_layer = []
+            for node in layer:
+                for dependent in reverse_get(node, _EMPTY):
+                    remaining = in_degree[dependent] - 1
+                    in_degree[dependent] = remaining
+                    if remaining == 0:
+                        next_layer.append(dependent)
+            next_layer.sort()
+            layer = next_layer
+
+        if processed != len(self.graph):
+            self._raise_unsorted([node for layer in layers for node in layer])
+
+        return layers
+
+    def _raise_unsorted(self, processed: List[str]) -> None:
+        """
+        Raise the error for a graph Kahn's algorithm could not fully order.
+
+        WHY: Shared by topological_sort() and topological_layers() so both report
+             cycles identically.
+
+        Raises:
+            ValueError: Always, listing cycles or the unprocessed nodes
+        """
+        cycles = self.detect_cycles()
+        if cycles:
+            cycle_strs = [" -> ".join(c) for c in cycles]
+            raise ValueError(
+                "Cannot perform topological sort: circular dependencies detected:\n"
+                + "\n".join(f"  - {c}" for c in cycle_strs)
+            )
+        unprocessed = set(self.graph.keys()) - set(processed)
+        raise ValueError(
+            f"Topological sort incomplete. Unprocessed nodes (likely in cycle): {unprocessed}"
+        )
+
     def get_subgraph(self, node: str) -> List[str]:
         """
         Get all dependencies of a node (transitive closure).
@@ -241,11 +455,16 @@ class DependencyResolver:
             node: Node ID to get dependencies for
 
         Returns:
-            Ordered list of all dependencies (including transitive)
+            Ordered list of all dependencies (including transitive).
+            The list is cached until the next load_graph(); treat it as read-only.
 
         Raises:
             KeyError: If node doesn't exist in graph
         """
+        cached = self._subgraph_cache.get(node)
+        if cached is not None:
+            return cached
+
         if node not in self.graph:
             raise KeyError(f"Node not found in graph: {node}")
 
@@ -258,17 +477,19 @@ class DependencyResolver:
             if dep not in visited:
                 visited.add(dep)
                 # WHY: Add this node's dependencies to queue for transitive closure
-                queue.extend(self.graph.get(dep, []))
+                queue.extend(self.graph.get(dep, _EMPTY))
 
-        # WHY: Return in topological order for correct execution sequence
-        all_order = self.topological_sort()
-        subgraph = [n for n in all_order if n in visited]
+        # WHY: Return in topological order for correct execution sequence.
+        #      A node without dependencies needs no ordering, so skip the sort
+        if visited:
+            subgraph = [n for n in self.topological_sort() if n in visited]
+        else:
+            subgraph = []
 
         if self.verbose:
-            print(
-                f"Subgraph for '{node}': {len(subgraph)} dependencies", file=sys.stderr
-            )
+            logger.debug("Subgraph for '%s': %d dependencies", node, len(subgraph))
 
+        self._subgraph_cache[node] = subgraph
         return subgraph
 
     def filter_tasks(
@@ -286,19 +507,23 @@ class DependencyResolver:
         Returns:
             Ordered list of node IDs that match predicate
         """
-        # WHY: Filter nodes using predicate, maintain insertion order
-        matching = [
+        # WHY: Collect matches in a set so the ordering pass below is O(1) per
+        #      node instead of a linear scan of the match list
+        matching = {
             node_id
             for node_id, node_data in self.nodes.items()
             if predicate(node_id, node_data)
-        ]
+        }
 
-        # WHY: Return in topological order for correct execution sequence
-        all_order = self.topological_sort()
-        filtered = [n for n in all_order if n in matching]
+        # WHY: Return in topological order for correct execution sequence.
+        #      With no matches there is nothing to order, so skip the sort
+        if matching:
+            filtered = [n for n in self.topological_sort() if n in matching]
+        else:
+            filtered = []
 
         if self.verbose:
-            print(f"Filter matched {len(filtered)} nodes", file=sys.stderr)
+            logger.debug("Filter matched %d nodes", len(filtered))
 
         return filtered
 
@@ -335,6 +560,11 @@ Output format (text):
 
 Output format (json):
   ["task_B", "task_C", "task_A"]
+
+Output format (text, --layers; one parallel wave per line):
+  task_B
+  task_C
+  task_A
         """,
     )
 
@@ -349,6 +579,11 @@ Output format (json):
         default="text",
         help="Output format (default: text)",
     )
+    parser.add_argument(
+        "--layers",
+        action="store_true",
+        help="Output parallel execution layers instead of a flat order",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose output to stderr"
     )
@@ -363,21 +598,36 @@ Output format (json):
         resolver.load_graph(args.input)
 
         # WHY: Perform topological sort (will raise on cycles)
-        order = resolver.topological_sort()
+        order: List[Any]
+        if args.layers:
+            order = resolver.topological_layers()
+        else:
+            order = resolver.topological_sort()
 
-        # WHY: Format output based on requested format
+        # WHY: Write to file or stdout based on arguments. Text output is streamed
+        #      one line at a time so huge sorts never build a joined copy of the
+        #      whole order in memory; JSON is serialized in one C-level call
         if args.format == "json":
-            output = json.dumps(order, indent=2)
+            # WHY: Written as UTF-8 bytes, bypassing the locale encoding of text
+            #      files and stdout, which may not be able to encode node names
+            output = _dumps(order) + b"\n"
+            if args.output:
+                atomic_write_bytes(Path(args.output), output)
+            else:
+                sys.stdout.flush()
+                sys.stdout.buffer.write(output)
         else:  # text
-            output = "\n".join(order)
-
-        # WHY: Write to file or stdout based on arguments
-        if args.output:
-            atomic_write_text(Path(args.output), output + "\n")
-            if args.verbose:
-                print(f"Written to {args.output}", file=sys.stderr)
-        else:
-            print(output)
+            if args.layers:
+                lines = (" ".join(layer) + "\n" for layer in order)
+            else:
+                lines = (node + "\n" for node in order)
+            if args.output:
+                atomic_write_lines(Path(args.output), lines)
+            else:
+                sys.stdout.writelines(lines)
+
+        if args.output and args.verbose:
+            logger.debug("Written to %s", args.output)
 
         # WHY: Exit with success code
         return 0
@@ -17,57 +17,32 @@ from __future__ import annotations
 
 # WHY: Standard library imports grouped together for clarity
 import argparse
+import importlib.util
 import sys
 from datetime import datetime
 from pathlib import Path
+from string import Template
 
-# WHY: Dynamic path insertion allows importing shared utilities from skill directory
 SKILLS_DIR = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(SKILLS_DIR / "shared"))
-from cross_platform import atomic_write_text  # type: ignore[import-not-found]  # noqa: E402
 
-
-def verify_output_file(output_path: Path) -> bool:
-    """
-    Verify that the output file was written successfully.
-
-    WHY: Post-write verification ensures file was actually created and is non-empty,
-    catching silent write failures that might occur with atomic writes or filesystem issues.
-
-    Args:
-        output_path: Path to the file that should exist
-
-    Returns:
-        True if file exists and is non-empty, False otherwise
-    """
-    if not output_path.exists():
-        return False
-    if output_path.stat().st_size == 0:
-        return False
-    return True
-
-
-def generate_planning_checklist(
-    project_name: str, phases: int, output_file: str | Path | None = None
-) -> None:
-    """
-    Generate a planning checklist for the given project.
-
-    WHY: This function encapsulates checklist generation logic separate from CLI handling,
-    making it reusable as a library function and easier to test.
-    """
-    output_path: Path
-    if output_file is None:
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        output_path = Path(f"checklist-{date_str}.md")
-    else:
-        output_path = Path(output_file)
-
-    content = f"""# Planning Checklist: {project_name}
-
-Project: {project_name}
-Phases: {phases}
-Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+# WHY: Load cross_platform straight from its file instead of prepending to
+# sys.path, which would invalidate the path importer cache for every import
+_spec = importlib.util.spec_from_file_location(
+    "cross_platform", SKILLS_DIR / "shared" / "cross_platform.py"
+)
+assert _spec is not None and _spec.loader is not None
+cross_platform = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cross_platform)
+atomic_write_bytes = cross_platform.atomic_write_bytes
+
+# WHY: The checklist text is fixed apart from a few fields, so it is compiled into
+# a Template once at import; each call only substitutes the placeholders
+_CHECKLIST_TEMPLATE = Template(
+    """# Planning Checklist: $project
+
+Project: $project
+Phases: $phases
+Generated: $generated
 
 ## Pre-Planning
 
@@ -116,7 +91,7 @@ Complete these items as you identify and plan for risks:
 
 Complete these items as you create your execution roadmap:
 
-- [ ] Project is broken into {phases} phases
+- [ ] Project is broken into $phases phases
 - [ ] Each phase has clear entry/exit criteria
 - [ ] Phases are sequenced by dependencies
 - [ ] Milestones are defined for each phase
@@ -220,9 +195,54 @@ _____________________________________________________________________________
 
 **Next step**: Begin execution according to the approved implementation plan.
 """
+)
+
+
+def verify_output_file(output_path: Path) -> bool:
+    """
+    Verify that the output file was written successfully.
+
+    WHY: Post-write verification ensures file was actually created and is non-empty,
+    catching silent write failures that might occur with atomic writes or filesystem issues.
+
+    Args:
+        output_path: Path to the file that should exist
+
+    Returns:
+        True if file exists and is non-empty, False otherwise
+    """
+    if not output_path.exists():
+        return False
+    if output_path.stat().st_size == 0:
+        return False
+    return True
+
+
+def generate_planning_checklist(
+    project_name: str, phases: int, output_file: str | Path | None = None
+) -> None:
+    """
+    Generate a planning checklist for the given project.
+
+    WHY: This function encapsulates checklist generation logic separate from CLI handling,
+    making it reusable as a library function and easier to test.
+    """
+    # WHY: One clock read keeps the default filename and the header timestamp in agreement
+    now = datetime.now()
+    output_path: Path
+    if output_file is None:
+        output_path = Path(f"checklist-{now:%Y-%m-%d}.md")
+    else:
+        output_path = Path(output_file)
+
+    content = _CHECKLIST_TEMPLATE.substitute(
+        project=project_name,
+        phases=phases,
+        generated=f"{now:%Y-%m-%d %H:%M:%S}",
+    ).encode("utf-8")
 
-    # WHY: atomic_write_text ensures file is written completely or not at all
-    atomic_write_text(output_path, content)
+    # WHY: atomic_write_bytes ensures file is written completely or not at all
+    atomic_write_bytes(output_path, content)
 
     # WHY: Post-write verification catches silent failures from filesystem issues
     if not verify_output_file(output_path):
@@ -16,13 +16,21 @@ Arguments:
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import sys
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 
 SKILLS_DIR = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(SKILLS_DIR / "shared"))
-from cross_platform import atomic_write_text  # type: ignore[import-not-found]  # noqa: E402
+# WHY: Load cross_platform straight from its file instead of prepending to
+# sys.path, which would invalidate the path importer cache for every import
+_spec = importlib.util.spec_from_file_location(
+    "cross_platform", SKILLS_DIR / "shared" / "cross_platform.py"
+)
+assert _spec is not None and _spec.loader is not None
+cross_platform = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cross_platform)
+atomic_write_text = cross_platform.atomic_write_text
 
 
 def verify(output_path: Path) -> None:
@@ -47,7 +55,7 @@ def generate_roadmap_template(phases: int, output_file: str) -> None:
 
 **Project**: [Project Name]
 **Number of Phases**: {phases}
-**Generated**: {datetime.now().strftime("%Y-%m-%d")}
+**Generated**: {date.today().isoformat()}
 
 ## Executive Summary
 
@@ -30,21 +30,66 @@ Arguments:
 import sys
 import argparse
 import csv
-import io
+import json
 import re
 from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 SKILLS_DIR = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(SKILLS_DIR / "shared"))
-from cross_platform import atomic_write_json, atomic_write_text  # type: ignore[import-not-found]  # noqa: E402
+from cross_platform import atomic_write_bytes, atomic_write_lines  # type: ignore[import-not-found]  # noqa: E402
+
+# WHY: orjson serializes in C and is much faster on large task lists; fall back
+# to the stdlib encoder so the script stays dependency-free
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# WHY: Plan-file patterns are compiled once at import instead of on every parse
+# call (and, for the dependency pattern, on every task via the re module cache)
+_GH_RE = re.compile(r"GH-(\d+)")
+# WHY: Phase headings and task lines share one alternation so a single finditer
+# walks the file in order; groups 1-2 are a phase, groups 3-4 are a task
+_PLAN_LINE_RE = re.compile(
+    r"^(?:##\s+(?:Phase\s+)?(\d+):\s*(.+)|-\s+\[([ x])\]\s+(.+))$", re.MULTILINE
+)
+_DEPS_RE = re.compile(r"Depends on:\s*([#\w\-,\s]+)", re.IGNORECASE)
+
+
+def _json_default(obj: Any) -> Dict[str, Any]:
+    """Encode Task objects met during serialization; reject anything else."""
+    if isinstance(obj, Task):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
 
 
 class Task:
     """Represents a single task with dependencies and metadata."""
 
+    # WHY: Plans and templates can hold thousands of tasks; slots drop the
+    # per-instance __dict__ and make attribute access cheaper
+    __slots__ = (
+        "task_id",
+        "phase",
+        "name",
+        "status",
+        "dependencies",
+        "assignee",
+        "notes",
+        "created",
+        "updated",
+    )
+
     def __init__(
         self,
         task_id: str,
@@ -54,6 +99,7 @@ class Task:
         dependencies: Optional[List[str]] = None,
         assignee: str = "",
         notes: str = "",
+        now: Optional[str] = None,
     ):
         """
         Initialize a task.
@@ -66,6 +112,7 @@ class Task:
             dependencies: List of task IDs this task depends on
             assignee: Person assigned to this task
             notes: Additional notes
+            now: ISO timestamp for created/updated (defaults to the current time)
         """
         self.task_id = task_id
         self.phase = phase
@@ -74,8 +121,10 @@ class Task:
         self.dependencies = dependencies or []
         self.assignee = assignee
         self.notes = notes
-        self.created = datetime.now().isoformat()
-        self.updated = datetime.now().isoformat()
+        # A new task was last updated when it was created; read the clock once
+        if now is None:
+            now = datetime.now().isoformat()
+        self.created = self.updated = now
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary."""
@@ -98,7 +147,8 @@ class Task:
             str(self.phase),
             self.name,
             self.status,
-            ",".join(self.dependencies),
+            # Most tasks have no dependencies; skip the join call for them
+            ",".join(self.dependencies) if self.dependencies else "",
             self.assignee,
             self.notes,
             self.created,
@@ -106,6 +156,40 @@ class Task:
         ]
 
 
+# Column order shared by every CSV export (must match Task.to_csv_row)
+_CSV_HEADERS = (
+    "id",
+    "phase",
+    "name",
+    "status",
+    "dependencies",
+    "assignee",
+    "notes",
+    "created",
+    "updated",
+)
+
+
+class _RowEcho:
+    """Pseudo-file whose write() hands the formatted CSV line back to the caller."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class DependencyAnalysis(NamedTuple):
+    """Result of one topological pass over the task dependency graph."""
+
+    # First (task_id, dep_id) pair referencing a task that does not exist
+    missing: Optional[Tuple[str, str]]
+    # False when a cycle kept some tasks out of the topological order
+    acyclic: bool
+    # Longest dependency chain length ending at each task, by task index
+    longest_path: List[int]
+    # Index of the previous task on that longest chain (-1 at the chain start)
+    predecessor: List[int]
+
+
 class TaskTracker:
     """Manages task collection, validation, and output."""
 
@@ -113,10 +197,100 @@ class TaskTracker:
         """Initialize task tracker."""
         self.tasks: List[Task] = []
         self.plan_file: Optional[str] = None
+        # WHY: Validation, critical path and export all need the same topological
+        # pass; it is computed once and reset whenever a task is added
+        self._analysis: Optional[DependencyAnalysis] = None
+        self._critical_path: Optional[List[str]] = None
+        # WHY: Graph passes work on dense integer indices into self.tasks instead
+        # of hashing task ID strings on every edge; IDs are resolved once here
+        self._id_to_idx: Dict[str, int] = {}
+        # Distinct phase numbers seen so far, maintained as tasks are added
+        self._phases: Set[int] = set()
+        # WHY: Template trackers have no dependency edges at all; knowing that
+        # lets validation and the critical path skip building the graph
+        self._has_deps = False
 
     def add_task(self, task: Task) -> None:
         """Add a task to the tracker."""
+        self._id_to_idx[task.task_id] = len(self.tasks)
         self.tasks.append(task)
+        self._phases.add(task.phase)
+        if task.dependencies:
+            self._has_deps = True
+        self._analysis = None
+        self._critical_path = None
+
+    @property
+    def phase_count(self) -> int:
+        """Number of distinct phases across all tasks."""
+        return len(self._phases)
+
+    def _analyze(self) -> DependencyAnalysis:
+        """
+        Run Kahn's algorithm once, collecting everything the callers need.
+
+        WHY: One pass builds the forward graph and in-degrees, finds dangling
+        dependencies, detects cycles (tasks left unprocessed) and computes the
+        longest path to every task, instead of each caller rebuilding its own
+        adjacency and in-degree maps.
+
+        Returns:
+            Cached dependency analysis for the current task list
+        """
+        if self._analysis is not None:
+            return self._analysis
+
+        id_to_idx = self._id_to_idx
+        n = len(self.tasks)
+
+        # Build adjacency list (dependency -> dependents) and in-degree count
+        graph: List[List[int]] = [[] for _ in range(n)]
+        in_degree: List[int] = [0] * n
+        missing: Optional[Tuple[str, str]] = None
+
+        for idx, task in enumerate(self.tasks):
+            for dep_id in task.dependencies:
+                dep_idx = id_to_idx.get(dep_id)
+                if dep_idx is None:
+                    # WHY: A dangling edge can never be satisfied; remember the
+                    # first one for validation and leave it out of the graph
+                    if missing is None:
+                        missing = (task.task_id, dep_id)
+                    continue
+                graph[dep_idx].append(idx)
+                in_degree[idx] += 1
+
+        # Find all tasks with no dependencies (starting points)
+        queue = deque([idx for idx in range(n) if in_degree[idx] == 0])
+
+        # Track longest path to each task
+        longest_path: List[int] = [0] * n
+        predecessor: List[int] = [-1] * n
+        processed = 0
+
+        # Process tasks in topological order
+        while queue:
+            current = queue.popleft()
+            processed += 1
+            next_length = longest_path[current] + 1
+
+            for neighbor in graph[current]:
+                # Update longest path if we found a longer one
+                if next_length > longest_path[neighbor]:
+                    longest_path[neighbor] = next_length
+                    predecessor[neighbor] = current
+
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+
+        self._analysis = DependencyAnalysis(
+            missing=missing,
+            acyclic=processed == n,
+            longest_path=longest_path,
+            predecessor=predecessor,
+        )
+        return self._analysis
 
     def validate_dependencies(self) -> None:
         """
@@ -125,56 +299,70 @@ class TaskTracker:
         Raises:
             SystemExit: If circular dependencies are detected
         """
-        # Build adjacency list
-        graph: Dict[str, List[str]] = {}
-        task_ids = {task.task_id for task in self.tasks}
+        # Without any edges there is nothing missing and nothing to cycle through
+        if not self._has_deps:
+            return
 
-        for task in self.tasks:
-            graph[task.task_id] = task.dependencies
+        analysis = self._analyze()
 
-            # Check that all dependencies exist
-            for dep_id in task.dependencies:
-                if dep_id not in task_ids:
-                    print(
-                        f"ERROR: Task {task.task_id} depends on non-existent task {dep_id}",
-                        file=sys.stderr,
-                    )
-                    sys.exit(1)
-
-        # Detect cycles using DFS with color marking
-        # WHITE (0): unvisited, GRAY (1): in current path, BLACK (2): fully processed
-        color: Dict[str, int] = {tid: 0 for tid in task_ids}
-
-        def has_cycle_dfs(node: str, path: List[str]) -> bool:
-            """DFS to detect cycles. Returns True if cycle found."""
-            if color[node] == 1:  # GRAY - found back edge (cycle)
-                cycle_start = path.index(node)
-                cycle_path = " -> ".join(path[cycle_start:] + [node])
-                print(
-                    f"ERROR: Circular dependency detected: {cycle_path}",
-                    file=sys.stderr,
-                )
-                return True
-
-            if color[node] == 2:  # BLACK - already processed
-                return False
+        # Check that all dependencies exist
+        if analysis.missing is not None:
+            task_id, dep_id = analysis.missing
+            print(
+                f"ERROR: Task {task_id} depends on non-existent task {dep_id}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
 
-            color[node] = 1  # Mark as GRAY (in current path)
-            path.append(node)
+        # WHY: Kahn's pass already proves an acyclic graph; the DFS below only runs
+        # when a cycle exists, to report the exact loop
+        if analysis.acyclic:
+            return
 
-            for neighbor in graph.get(node, []):
-                if has_cycle_dfs(neighbor, path):
-                    return True
+        # Every dependency resolves here: missing ones exited above
+        id_to_idx = self._id_to_idx
+        graph: List[List[int]] = [
+            [id_to_idx[dep_id] for dep_id in task.dependencies] for task in self.tasks
+        ]
 
-            path.pop()
-            color[node] = 2  # Mark as BLACK (fully processed)
-            return False
+        # Detect cycles using DFS with color marking
+        # WHITE (0): unvisited, GRAY (1): in current path, BLACK (2): fully processed
+        color: List[int] = [0] * len(graph)
 
         # Check each unvisited node
-        for task_id in task_ids:
-            if color[task_id] == 0:
-                if has_cycle_dfs(task_id, []):
+        for start in range(len(graph)):
+            if color[start] != 0:
+                continue
+
+            # WHY: Iterative DFS with an explicit stack of neighbor iterators avoids
+            # a Python call per edge and cannot hit the recursion limit on deep
+            # dependency chains; path mirrors the stack for cycle reporting
+            color[start] = 1
+            path: List[int] = [start]
+            stack = [iter(graph[start])]
+
+            while stack:
+                neighbor = next(stack[-1], None)
+
+                if neighbor is None:
+                    # All neighbors explored - mark BLACK and backtrack
+                    stack.pop()
+                    color[path.pop()] = 2
+                elif color[neighbor] == 1:  # GRAY - found back edge (cycle)
+                    cycle_start = path.index(neighbor)
+                    cycle_path = " -> ".join(
+                        self.tasks[idx].task_id
+                        for idx in path[cycle_start:] + [neighbor]
+                    )
+                    print(
+                        f"ERROR: Circular dependency detected: {cycle_path}",
+                        file=sys.stderr,
+                    )
                     sys.exit(1)
+                elif color[neighbor] == 0:  # WHITE - descend into it
+                    color[neighbor] = 1
+                    path.append(neighbor)
+                    stack.append(iter(graph[neighbor]))
 
     def calculate_critical_path(self) -> List[str]:
         """
@@ -183,47 +371,32 @@ class TaskTracker:
         Returns:
             List of task IDs representing the critical path
         """
-        # Build adjacency list and in-degree count
-        graph: Dict[str, List[str]] = {task.task_id: [] for task in self.tasks}
-        in_degree: Dict[str, int] = {task.task_id: 0 for task in self.tasks}
-
-        for task in self.tasks:
-            for dep_id in task.dependencies:
-                graph[dep_id].append(task.task_id)
-                in_degree[task.task_id] += 1
-
-        # Find all tasks with no dependencies (starting points)
-        queue = deque([tid for tid, degree in in_degree.items() if degree == 0])
-
-        # Track longest path to each task
-        longest_path: Dict[str, int] = {tid: 0 for tid in graph}
-        predecessor: Dict[str, Optional[str]] = {tid: None for tid in graph}
-
-        # Process tasks in topological order
-        while queue:
-            current = queue.popleft()
+        # WHY: Validation and export both report the critical path; the walk is
+        # reused until another task is added
+        if self._critical_path is not None:
+            return self._critical_path
 
-            for neighbor in graph[current]:
-                # Update longest path if we found a longer one
-                if longest_path[current] + 1 > longest_path[neighbor]:
-                    longest_path[neighbor] = longest_path[current] + 1
-                    predecessor[neighbor] = current
+        # Every chain has length one without edges; the first task stands for it
+        if not self._has_deps:
+            self._critical_path = [self.tasks[0].task_id] if self.tasks else []
+            return self._critical_path
 
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+        analysis = self._analyze()
+        longest_path = analysis.longest_path
+        predecessor = analysis.predecessor
 
         # Find the task with the longest path (end of critical path)
-        critical_end = max(longest_path.items(), key=lambda x: x[1])[0]
+        current = max(range(len(longest_path)), key=longest_path.__getitem__)
 
-        # Reconstruct critical path by walking backwards through predecessors
+        # Reconstruct critical path by walking backwards through predecessors,
+        # converting indices back to task IDs only here
         critical_path: List[str] = []
-        current_node: Optional[str] = critical_end
-        while current_node is not None:
-            critical_path.append(current_node)
-            current_node = predecessor[current_node]
+        while current != -1:
+            critical_path.append(self.tasks[current].task_id)
+            current = predecessor[current]
 
         critical_path.reverse()
+        self._critical_path = critical_path
         return critical_path
 
     def parse_plan_file(self, plan_path: str) -> None:
@@ -249,73 +422,72 @@ class TaskTracker:
             sys.exit(1)
 
         self.plan_file = plan_path
-        content = plan_file.read_text(encoding="utf-8")
+        # WHY: One bulk read and a single decode instead of streaming through a
+        # TextIOWrapper; utf-8-sig drops a leading BOM that would otherwise hide
+        # a phase heading on the first line from the ^## match
+        content = plan_file.read_bytes().decode("utf-8-sig")
 
         # Extract GH issue number from filename (GH-{number}-{slug}.md)
-        gh_match = re.search(r"GH-(\d+)", plan_file.name)
+        gh_match = _GH_RE.search(plan_file.name)
         gh_prefix = f"GH{gh_match.group(1)}" if gh_match else "T"
 
-        phase_pattern = re.compile(r"^##\s+(?:Phase\s+)?(\d+):\s*(.+)$", re.MULTILINE)
-        task_pattern = re.compile(r"^-\s+\[([ x])\]\s+(.+)$", re.MULTILINE)
+        task_counter = 1
+        phase_num: Optional[int] = None
+        # WHY: Tasks parsed in one run share a creation timestamp; formatting it
+        # once avoids a clock read and isoformat() per task
+        batch_now = datetime.now().isoformat()
+
+        for line_match in _PLAN_LINE_RE.finditer(content):
+            if line_match.group(1) is not None:
+                phase_num = int(line_match.group(1))
+                continue
+            # Tasks above the first phase heading belong to no phase; skip them
+            if phase_num is None:
+                continue
+
+            is_completed = line_match.group(3) == "x"
+            task_desc = line_match.group(4).strip()
+
+            # Extract dependencies from task description
+            dependencies: List[str] = []
+            dep_match = _DEPS_RE.search(task_desc)
+            if dep_match:
+                dependencies = [
+                    d.strip().lstrip("#")
+                    for d in dep_match.group(1).split(",")
+                    if d.strip()
+                ]
+                # WHY: Cut the dependency text out using the match bounds instead
+                # of running the same pattern again through re.sub
+                task_desc = (
+                    task_desc[: dep_match.start()].rstrip()
+                    + task_desc[dep_match.end() :]
+                ).strip()
+
+            # Generate task ID
+            task_id = f"{gh_prefix}-{task_counter:03d}"
+            task_counter += 1
+
+            status = "completed" if is_completed else "pending"
+
+            task = Task(
+                task_id=task_id,
+                phase=phase_num,
+                name=task_desc,
+                status=status,
+                dependencies=dependencies,
+                now=batch_now,
+            )
 
-        # Find all phases
-        phases = list(phase_pattern.finditer(content))
+            self.add_task(task)
 
-        if not phases:
+        if phase_num is None:
             print(
                 "ERROR: No phases found in plan file. Expected '## Phase N: Name' format",
                 file=sys.stderr,
             )
             sys.exit(1)
 
-        task_counter = 1
-
-        for i, phase_match in enumerate(phases):
-            phase_num = int(phase_match.group(1))
-            # phase_match.group(2) contains phase name but is not used
-
-            # Extract content between this phase and next phase (or end of file)
-            start_pos = phase_match.end()
-            end_pos = phases[i + 1].start() if i + 1 < len(phases) else len(content)
-            phase_content = content[start_pos:end_pos]
-
-            # Find all tasks in this phase
-            for task_match in task_pattern.finditer(phase_content):
-                is_completed = task_match.group(1) == "x"
-                task_desc = task_match.group(2).strip()
-
-                # Extract dependencies from task description
-                dependencies: List[str] = []
-                dep_match = re.search(
-                    r"Depends on:\s*([#\w\-,\s]+)", task_desc, re.IGNORECASE
-                )
-                if dep_match:
-                    dep_str = dep_match.group(1)
-                    dependencies = [d.strip().lstrip("#") for d in dep_str.split(",")]
-                    # Remove dependency text from description
-                    task_desc = re.sub(
-                        r"\s*Depends on:\s*[#\w\-,\s]+",
-                        "",
-                        task_desc,
-                        flags=re.IGNORECASE,
-                    ).strip()
-
-                # Generate task ID
-                task_id = f"{gh_prefix}-{task_counter:03d}"
-                task_counter += 1
-
-                status = "completed" if is_completed else "pending"
-
-                task = Task(
-                    task_id=task_id,
-                    phase=phase_num,
-                    name=task_desc,
-                    status=status,
-                    dependencies=dependencies,
-                )
-
-                self.add_task(task)
-
     def generate_template(self, phases: int, tasks_per_phase: int) -> None:
         """
         Generate empty task template.
@@ -325,6 +497,7 @@ class TaskTracker:
             tasks_per_phase: Tasks to pre-allocate per phase
         """
         task_counter = 1
+        batch_now = datetime.now().isoformat()
 
         for phase in range(1, phases + 1):
             for task_num in range(1, tasks_per_phase + 1):
@@ -336,37 +509,60 @@ class TaskTracker:
                     phase=phase,
                     name=f"[Task {task_num} description]",
                     status="pending",
+                    now=batch_now,
                 )
 
                 self.add_task(task)
 
-    def export_csv(self, output_path: str) -> None:
+    @staticmethod
+    def export_template_csv(
+        phases: int, tasks_per_phase: int, output_path: str
+    ) -> None:
         """
-        Export tasks to CSV format.
+        Write an empty task template straight to CSV.
+
+        Produces the same file as generate_template() followed by export_csv(),
+        without creating Task objects.
 
         Args:
+            phases: Number of phases
+            tasks_per_phase: Tasks to pre-allocate per phase
             output_path: Output file path
         """
-        headers = [
-            "id",
-            "phase",
-            "name",
-            "status",
-            "dependencies",
-            "assignee",
-            "notes",
-            "created",
-            "updated",
-        ]
+        now = datetime.now().isoformat()
+
+        # WHY: Template rows have a fixed shape and no field that needs quoting,
+        # so each row is formatted directly rather than via Task and csv.writer
+        def rows() -> Iterator[str]:
+            yield csv.writer(_RowEcho()).writerow(_CSV_HEADERS)
+            tail = f",pending,,,,{now},{now}\r\n"
+            task_counter = 1
+            for phase in range(1, phases + 1):
+                for task_num in range(1, tasks_per_phase + 1):
+                    name = f"[Task {task_num} description]"
+                    yield f"T-{task_counter:03d},{phase},{name}{tail}"
+                    task_counter += 1
+
+        atomic_write_lines(Path(output_path), rows())
+        print(f"CSV task tracker exported: {output_path}")
 
-        # Build CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(headers)
-        for task in self.tasks:
-            writer.writerow(task.to_csv_row())
+    def export_csv(self, output_path: str) -> None:
+        """
+        Export tasks to CSV format.
 
-        atomic_write_text(Path(output_path), output.getvalue())
+        Args:
+            output_path: Output file path
+        """
+        # WHY: csv.writer.writerow returns whatever the target's write() returns,
+        # so rows are formatted one at a time and streamed into the temp file
+        # instead of buffering the whole document in a StringIO first
+        def rows() -> Iterator[str]:
+            writer = csv.writer(_RowEcho())
+            yield writer.writerow(_CSV_HEADERS)
+            for task in self.tasks:
+                yield writer.writerow(task.to_csv_row())
+
+        atomic_write_lines(Path(output_path), rows())
         print(f"CSV task tracker exported: {output_path}")
 
     def export_json(self, output_path: str) -> None:
@@ -382,16 +578,18 @@ class TaskTracker:
             "version": "1.0",
             "plan_file": self.plan_file,
             "generated": datetime.now().isoformat(),
-            "tasks": [task.to_dict() for task in self.tasks],
+            # WHY: Task objects go to the encoder as-is; _json_default turns each
+            # into a short-lived dict instead of materializing one per task upfront
+            "tasks": self.tasks,
             "metadata": {
                 "total_tasks": len(self.tasks),
-                "phases": len(set(task.phase for task in self.tasks)),
+                "phases": self.phase_count,
                 "critical_path": critical_path,
                 "critical_path_length": len(critical_path),
             },
         }
 
-        atomic_write_json(Path(output_path), data)
+        atomic_write_bytes(Path(output_path), _dumps(data))
         print(f"JSON task tracker exported: {output_path}")
 
     def export(self, output_path: str) -> None:
@@ -430,9 +628,7 @@ def validate_plan_structure(plan_path: str) -> None:
     tracker = TaskTracker()
     tracker.parse_plan_file(plan_path)
 
-    print(
-        f"✓ Found {len(tracker.tasks)} tasks across {len(set(t.phase for t in tracker.tasks))} phases"
-    )
+    print(f"✓ Found {len(tracker.tasks)} tasks across {tracker.phase_count} phases")
 
     print("Validating dependencies...")
     tracker.validate_dependencies()
@@ -504,6 +700,11 @@ Examples:
         validate_plan_structure(args.from_plan)
         return
 
+    # Templates have no dependencies to validate; CSV ones skip Task objects
+    if not args.from_plan and Path(args.output).suffix.lower() == ".csv":
+        TaskTracker.export_template_csv(args.phases, args.tasks_per_phase, args.output)
+        return
+
     # Create tracker
     tracker = TaskTracker()
 
@@ -6,12 +6,14 @@ WHY: Pluggable architecture allows adding custom checks without modifying core l
 WHY: Severity levels enable filtering and prioritization of issues.
 """
 
-import argparse
+import hashlib
 import json
+import os
+import re
 import sys
-from abc import ABC, abstractmethod
+import time
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
@@ -20,17 +22,78 @@ sys.path.insert(0, str(SKILLS_DIR / "shared"))
 from cross_platform import atomic_write_json, run_command  # type: ignore[import-not-found]  # noqa: E402
 from thresholds import TIMEOUTS  # type: ignore[import-not-found]  # noqa: E402
 
+# WHY: Common test file patterns (test_*.py, *_test.py, test*.js, *.test.js,
+# *.test.ts, *_spec.rb, test_*.rs) folded into one pattern so each file name
+# is tested once, and a file matching two patterns is not counted twice
+_TEST_FILE_RE = re.compile(
+    r"(?:test_.*\.py|.*_test\.py|test.*\.js|.*\.test\.[jt]s|.*_spec\.rb|test_.*\.rs)",
+    re.DOTALL,
+)
+# WHY: Dependency, cache and build trees under a test directory hold no project
+# tests but can hold tens of thousands of files
+_SKIPPED_TEST_SUBDIRS = frozenset(
+    {"node_modules", "__pycache__", "venv", "target", "dist", "build"}
+)
+# The count only feeds a message; stop walking once it is clearly "many"
+_TEST_FILE_COUNT_CAP = 500
+# GitHub Actions workflow file extensions
+_WORKFLOW_EXTS = (".yml", ".yaml")
+
+# WHY: CI pipelines often run the auditor several times in a row (per severity
+# filter or output target); results younger than this are reused from disk.
+# One cache file is kept per project, so the directory stays bounded
+CACHE_DIR = Path.home() / ".cache" / "eaa-health-auditor"
+CACHE_TTL_SECONDS = 60.0
+# WHY: The git check reports the working tree state, which edits to tracked
+# files change without touching anything in the cache key; it always runs
+_UNCACHED_CHECKS = frozenset({"git"})
+# Files whose change should invalidate cached results, relative to the project.
+# WHY: The project root, test and workflow directories are included because
+# their mtimes change when entries are added or removed, which is what the
+# docs, tests and ci checks look at. .git/index is left out: git status
+# refreshes it, so its mtime changes on every run that includes the git check
+_CACHE_KEY_FILES = (
+    ".git/packed-refs",
+    "pyproject.toml",
+    "package.json",
+    ".",
+    "tests",
+    "test",
+    "__tests__",
+    "spec",
+    ".github",
+    ".github/workflows",
+)
+
+
+def _read_text_or_empty(path: Path) -> str:
+    """Return file text, or an empty string when it cannot be read."""
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def _mtime_token(path: Path) -> str:
+    """Return the file's mtime in nanoseconds, or "-" when it is missing."""
+    try:
+        return str(path.stat().st_mtime_ns)
+    except OSError:
+        return "-"
+
 
-class Severity(Enum):
+class Severity(IntEnum):
     """Severity levels for health check results.
 
     WHY: Enables filtering and prioritization of issues.
     WHY: CRITICAL issues should block deployment, WARNING should be reviewed, INFO is advisory.
+    WHY: Integer values make severity comparisons plain int compares; reports
+    still use the member name.
     """
 
-    CRITICAL = "CRITICAL"
-    WARNING = "WARNING"
-    INFO = "INFO"
+    CRITICAL = 2
+    WARNING = 1
+    INFO = 0
 
     @classmethod
     def from_string(cls, value: str) -> "Severity":
@@ -42,10 +105,28 @@ class Severity(Enum):
                 f"Invalid severity: {value}. Must be one of: {', '.join(s.name for s in cls)}"
             )
 
-    def __ge__(self, other: "Severity") -> bool:
-        """Enable severity comparison for filtering."""
-        severity_order = {Severity.INFO: 0, Severity.WARNING: 1, Severity.CRITICAL: 2}
-        return severity_order[self] >= severity_order[other]
+
+class TopLevelEntries:
+    """Names found directly under the project root, from one directory scan.
+
+    WHY: Checks mostly ask whether a given file or directory exists at the root;
+    answering from one os.scandir replaces a stat call per candidate name.
+    """
+
+    __slots__ = ("names", "dirs")
+
+    def __init__(self, project_path: Path):
+        """Scan project_path once and record its entry names and directories."""
+        with os.scandir(project_path) as entries:
+            names: set[str] = set()
+            dirs: set[str] = set()
+            for entry in entries:
+                names.add(entry.name)
+                # WHY: Follows symlinks, matching Path.is_dir()
+                if entry.is_dir():
+                    dirs.add(entry.name)
+        self.names = frozenset(names)
+        self.dirs = frozenset(dirs)
 
 
 @dataclass
@@ -67,42 +148,56 @@ class CheckResult:
         return {
             "name": self.name,
             "passed": self.passed,
-            "severity": self.severity.value,
+            "severity": self.severity.name,
             "message": self.message,
             "fix_hint": self.fix_hint,
             "details": self.details,
         }
 
 
-class HealthCheck(ABC):
+class HealthCheck:
     """Base class for all health checks.
 
-    WHY: Abstract base enforces consistent interface across all check types.
+    WHY: Shared base keeps a consistent interface across all check types.
+    WHY: A plain class rather than an ABC: the check registry is closed, so
+    abstract enforcement adds nothing; name and run() raise if left unset.
     WHY: Subclasses only need to implement check logic, not result formatting.
     """
 
-    def __init__(self, project_path: Path, verbose: bool = False):
+    def __init__(
+        self,
+        project_path: Path,
+        verbose: bool = False,
+        top_level: TopLevelEntries | None = None,
+    ):
         """Initialize health check with project path.
 
         WHY: All checks need project context to operate.
         WHY: Verbose mode helps debug check failures.
+        WHY: The auditor passes one shared root scan so checks do not re-stat.
         """
         self.project_path = project_path
         self.verbose = verbose
+        self._top_level = top_level
+
+    @property
+    def top_level(self) -> TopLevelEntries:
+        """Entries directly under the project root, scanned on first use."""
+        if self._top_level is None:
+            self._top_level = TopLevelEntries(self.project_path)
+        return self._top_level
 
     @property
-    @abstractmethod
     def name(self) -> str:
         """Unique identifier for this check."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def run(self) -> CheckResult:
         """Execute the health check and return result.
 
         WHY: Each check implements its own validation logic.
         """
-        pass
+        raise NotImplementedError
 
     def _run_command(
         self, cmd: list[str], cwd: Path | None = None
@@ -143,7 +238,7 @@ class GitCheck(HealthCheck):
         git_dir = self.project_path / ".git"
 
         # Check if .git exists
-        if not git_dir.exists():
+        if ".git" not in self.top_level.names:
             return CheckResult(
                 name=self.name,
                 passed=False,
@@ -200,39 +295,40 @@ class DepsCheck(HealthCheck):
     WHY: Lockfiles ensure deterministic builds.
     """
 
+    # WHY: Different ecosystems use different files; flat filename -> ecosystem
+    # maps, built once, in the order results are reported
+    _DEP_FILE_TO_ECO = {
+        "pyproject.toml": "python",
+        "requirements.txt": "python",
+        "setup.py": "python",
+        "package.json": "node",
+        "Cargo.toml": "rust",
+    }
+    _LOCK_FILE_TO_ECO = {
+        "uv.lock": "python",
+        "poetry.lock": "python",
+        "Pipfile.lock": "python",
+        "package-lock.json": "node",
+        "yarn.lock": "node",
+        "pnpm-lock.yaml": "node",
+        "Cargo.lock": "rust",
+    }
+
     @property
     def name(self) -> str:
         return "deps"
 
     def run(self) -> CheckResult:
         """Check for dependency and lockfile presence."""
-        # WHY: Different ecosystems use different files
-        dep_files = {
-            "python": ["pyproject.toml", "requirements.txt", "setup.py"],
-            "node": ["package.json"],
-            "rust": ["Cargo.toml"],
-        }
-
-        lock_files = {
-            "python": ["uv.lock", "poetry.lock", "Pipfile.lock"],
-            "node": ["package-lock.json", "yarn.lock", "pnpm-lock.yaml"],
-            "rust": ["Cargo.lock"],
-        }
-
-        found_deps = []
-        found_locks = []
-
-        # Check for any dependency file
-        for ecosystem, files in dep_files.items():
-            for filename in files:
-                if (self.project_path / filename).exists():
-                    found_deps.append((ecosystem, filename))
+        present = self.top_level.names
 
-        # Check for lockfiles
-        for ecosystem, files in lock_files.items():
-            for filename in files:
-                if (self.project_path / filename).exists():
-                    found_locks.append((ecosystem, filename))
+        # Check for any dependency file and for lockfiles
+        found_deps = [
+            (eco, f) for f, eco in self._DEP_FILE_TO_ECO.items() if f in present
+        ]
+        found_locks = [
+            (eco, f) for f, eco in self._LOCK_FILE_TO_ECO.items() if f in present
+        ]
 
         if not found_deps:
             return CheckResult(
@@ -283,7 +379,7 @@ class TestsCheck(HealthCheck):
         # WHY: Common test directory patterns
         test_dirs = ["tests", "test", "__tests__", "spec"]
 
-        found_dirs = [d for d in test_dirs if (self.project_path / d).is_dir()]
+        found_dirs = [d for d in test_dirs if d in self.top_level.dirs]
 
         if not found_dirs:
             return CheckResult(
@@ -296,23 +392,24 @@ class TestsCheck(HealthCheck):
             )
 
         # Count test files
-        test_files: list[Path] = []
+        # WHY: One pruned os.walk per directory instead of a full rglob per pattern
+        test_file_count = 0
+        capped = False
+        is_test_file = _TEST_FILE_RE.fullmatch
         for test_dir in found_dirs:
-            test_path = self.project_path / test_dir
-            # WHY: Common test file patterns
-            patterns = [
-                "test_*.py",
-                "*_test.py",
-                "test*.js",
-                "*.test.js",
-                "*.test.ts",
-                "*_spec.rb",
-                "test_*.rs",
-            ]
-            for pattern in patterns:
-                test_files.extend(test_path.rglob(pattern))
-
-        test_file_count = len(test_files)
+            for _, dirnames, filenames in os.walk(self.project_path / test_dir):
+                dirnames[:] = [
+                    d
+                    for d in dirnames
+                    if not d.startswith(".") and d not in _SKIPPED_TEST_SUBDIRS
+                ]
+                test_file_count += sum(1 for f in filenames if is_test_file(f))
+                if test_file_count >= _TEST_FILE_COUNT_CAP:
+                    capped = True
+                    break
+            if capped:
+                test_file_count = _TEST_FILE_COUNT_CAP
+                break
 
         if test_file_count == 0:
             return CheckResult(
@@ -328,9 +425,13 @@ class TestsCheck(HealthCheck):
             name=self.name,
             passed=True,
             severity=Severity.INFO,
-            message=f"Found {test_file_count} test files in {found_dirs}",
+            message=f"Found {test_file_count}{'+' if capped else ''} test files in {found_dirs}",
             fix_hint="",
-            details={"found_dirs": found_dirs, "test_file_count": test_file_count},
+            details={
+                "found_dirs": found_dirs,
+                "test_file_count": test_file_count,
+                "test_file_count_capped": capped,
+            },
         )
 
 
@@ -347,8 +448,8 @@ class DocsCheck(HealthCheck):
 
     def run(self) -> CheckResult:
         """Check for essential documentation files."""
-        readme_exists = (self.project_path / "README.md").exists()
-        claude_md_exists = (self.project_path / "CLAUDE.md").exists()
+        readme_exists = "README.md" in self.top_level.names
+        claude_md_exists = "CLAUDE.md" in self.top_level.names
 
         missing = []
         if not readme_exists:
@@ -398,7 +499,8 @@ class CICheck(HealthCheck):
         """Check for GitHub Actions workflows."""
         workflows_dir = self.project_path / ".github" / "workflows"
 
-        if not workflows_dir.exists():
+        # WHY: Most projects without CI lack .github entirely; skip the stat then
+        if ".github" not in self.top_level.dirs or not workflows_dir.exists():
             return CheckResult(
                 name=self.name,
                 passed=False,
@@ -409,10 +511,16 @@ class CICheck(HealthCheck):
             )
 
         # Count workflow files
-        workflow_files = list(workflows_dir.glob("*.yml")) + list(
-            workflows_dir.glob("*.yaml")
-        )
-        workflow_count = len(workflow_files)
+        # WHY: One directory listing checked against both extensions instead of
+        # two glob passes over the same directory
+        try:
+            with os.scandir(workflows_dir) as entries:
+                workflow_count = sum(
+                    1 for e in entries if e.name.endswith(_WORKFLOW_EXTS)
+                )
+        except NotADirectoryError:
+            # A plain file named workflows holds no workflow files
+            workflow_count = 0
 
         if workflow_count == 0:
             return CheckResult(
@@ -449,6 +557,9 @@ class HealthAuditor:
         "docs": DocsCheck,
         "ci": CICheck,
     }
+    # WHY: Derived once from the registry for name validation and messages
+    _AVAILABLE_KEYS = frozenset(AVAILABLE_CHECKS)
+    _AVAILABLE_HELP = ", ".join(AVAILABLE_CHECKS)
 
     def __init__(self, project_path: Path, verbose: bool = False):
         """Initialize auditor with project path.
@@ -459,36 +570,140 @@ class HealthAuditor:
         self.verbose = verbose
         self.results: list[CheckResult] = []
 
+    def _cache_path(self, cache_dir: Path) -> Path:
+        """Return this project's cache file.
+
+        WHY: Named after the project path only, so each run overwrites the
+        previous entry instead of leaving one file per state behind.
+        """
+        name = hashlib.sha256(str(self.project_path).encode("utf-8")).hexdigest()
+        return cache_dir / f"{name}.json"
+
+    def _cache_key(self, check_names: list[str]) -> str:
+        """Return the key for these checks against the project's state.
+
+        WHY: The key covers the checked commit (read from .git without spawning
+        git), the dependency manifests and the directories the checks list, so
+        commits, dependency edits and added or removed files all miss the
+        cache; the TTL bounds other staleness.
+        """
+        git_dir = self.project_path / ".git"
+        head = _read_text_or_empty(git_dir / "HEAD")
+        parts = [",".join(check_names), head]
+        if head.startswith("ref: "):
+            parts.append(_read_text_or_empty(git_dir / head[5:]))
+        parts.extend(_mtime_token(self.project_path / rel) for rel in _CACHE_KEY_FILES)
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _load_cached_results(
+        self, cache_file: Path, key: str
+    ) -> list[CheckResult] | None:
+        """Load unfiltered results from a fresh cache file matching key, if any."""
+        try:
+            if time.time() - cache_file.stat().st_mtime >= CACHE_TTL_SECONDS:
+                return None
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            if data["key"] != key:
+                return None
+            return [
+                CheckResult(**{**item, "severity": Severity[item["severity"]]})
+                for item in data["results"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            # WHY: A missing, expired or corrupt cache just means running the checks
+            return None
+
     def run_checks(
-        self, check_names: list[str] | None = None, min_severity: Severity | None = None
+        self,
+        check_names: list[str] | None = None,
+        min_severity: Severity | None = None,
+        cache_dir: Path | None = None,
     ) -> list[CheckResult]:
         """Run specified checks and return results.
 
         WHY: Allows selective check execution and severity filtering.
+        WHY: With cache_dir set, unfiltered results of the filesystem checks are
+        reused for CACHE_TTL_SECONDS so repeated runs with different severity
+        filters share one audit; the git check is always run live.
         """
         if check_names is None:
             check_names = list(self.AVAILABLE_CHECKS.keys())
 
         # Validate check names
-        invalid_checks = set(check_names) - set(self.AVAILABLE_CHECKS.keys())
+        invalid_checks = set(check_names) - self._AVAILABLE_KEYS
         if invalid_checks:
-            available = ", ".join(self.AVAILABLE_CHECKS.keys())
             raise ValueError(
-                f"Invalid check names: {invalid_checks}. Available: {available}"
+                f"Invalid check names: {invalid_checks}. Available: {self._AVAILABLE_HELP}"
             )
 
         self.results = []
 
-        for check_name in check_names:
+        cacheable = [n for n in check_names if n not in _UNCACHED_CHECKS]
+        cache_file = None
+        cache_key = ""
+        cached: list[CheckResult] | None = None
+        if cache_dir is not None and cacheable:
+            cache_file = self._cache_path(cache_dir)
+            cache_key = self._cache_key(cacheable)
+            cached = self._load_cached_results(cache_file, cache_key)
+            if cached is not None and self.verbose:
+                print(f"Using cached results: {cache_file}", file=sys.stderr)
+
+        to_run = (
+            check_names
+            if cached is None
+            else [n for n in check_names if n in _UNCACHED_CHECKS]
+        )
+
+        # WHY: One root scan per run, taken before any worker starts, is shared by
+        # every check; a later run rescans so it sees files created in between
+        top_level = TopLevelEntries(self.project_path)
+        checks: list[HealthCheck] = []
+        for check_name in to_run:
             check_class = self.AVAILABLE_CHECKS[check_name]
-            # NOTE: mypy sees abstract HealthCheck but all entries are concrete subclasses
-            check = check_class(self.project_path, verbose=self.verbose)  # type: ignore[abstract]
+            checks.append(
+                check_class(self.project_path, verbose=self.verbose, top_level=top_level)
+            )
 
+            # WHY: Announced from this thread so the log order matches --checks
             if self.verbose:
                 print(f"Running check: {check_name}...", file=sys.stderr)
 
-            result = check.run()
-
+        if len(checks) < 2:
+            results = [check.run() for check in checks]
+        else:
+            # WHY: Imported here because only multi-check runs use a pool
+            from concurrent.futures import ThreadPoolExecutor
+
+            # WHY: Checks block on subprocesses and filesystem stats; running them
+            # on worker threads overlaps that latency, and executor.map yields
+            # results in submission order so the report order stays stable
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                results = list(executor.map(lambda check: check.run(), checks))
+
+        if cached is not None:
+            # WHY: Merge back in --checks order; result names are the check names
+            by_name = {r.name: r for r in cached}
+            by_name.update((r.name, r) for r in results)
+            results = [by_name[n] for n in check_names]
+        elif cache_file is not None:
+            try:
+                atomic_write_json(
+                    cache_file,
+                    {
+                        "key": cache_key,
+                        "results": [
+                            r.to_dict()
+                            for r in results
+                            if r.name not in _UNCACHED_CHECKS
+                        ],
+                    },
+                )
+            except OSError:
+                # WHY: An unwritable cache directory must not fail the audit
+                pass
+
+        for result in results:
             # WHY: Filter by severity if specified
             if min_severity is None or result.severity >= min_severity:
                 self.results.append(result)
@@ -500,37 +715,25 @@ class HealthAuditor:
 
         WHY: Provides overview statistics for quick health assessment.
         """
-        passed_count = sum(1 for r in self.results if r.passed)
-        failed_count = len(self.results) - passed_count
-
-        # WHY: Group failures by severity for prioritization
-        failed_by_severity = {
-            "CRITICAL": [
-                r
-                for r in self.results
-                if not r.passed and r.severity == Severity.CRITICAL
-            ],
-            "WARNING": [
-                r
-                for r in self.results
-                if not r.passed and r.severity == Severity.WARNING
-            ],
-            "INFO": [
-                r for r in self.results if not r.passed and r.severity == Severity.INFO
-            ],
-        }
+        # WHY: Group failures by severity for prioritization; one pass counts them
+        # and serializes each result instead of building a list per severity
+        passed_count = 0
+        failed_by_severity = {"CRITICAL": 0, "WARNING": 0, "INFO": 0}
+        checks = []
+        for r in self.results:
+            if r.passed:
+                passed_count += 1
+            else:
+                failed_by_severity[r.severity.name] += 1
+            checks.append(r.to_dict())
 
         return {
             "project_path": str(self.project_path),
             "total_checks": len(self.results),
             "passed": passed_count,
-            "failed": failed_count,
-            "failed_by_severity": {
-                "CRITICAL": len(failed_by_severity["CRITICAL"]),
-                "WARNING": len(failed_by_severity["WARNING"]),
-                "INFO": len(failed_by_severity["INFO"]),
-            },
-            "checks": [r.to_dict() for r in self.results],
+            "failed": len(self.results) - passed_count,
+            "failed_by_severity": failed_by_severity,
+            "checks": checks,
         }
 
 
@@ -539,6 +742,9 @@ def main() -> None:
 
     WHY: Provides command-line interface for scripting and CI integration.
     """
+    # WHY: Imported here so modules importing HealthAuditor do not pay for it
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Universal Health Audit Framework for Project Quality Checks",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -560,7 +766,7 @@ Examples:
     parser.add_argument(
         "--checks",
         type=str,
-        help=f"Comma-separated check names (default: all). Available: {', '.join(HealthAuditor.AVAILABLE_CHECKS.keys())}",
+        help=f"Comma-separated check names (default: all). Available: {HealthAuditor._AVAILABLE_HELP}",
     )
 
     parser.add_argument(
@@ -575,6 +781,15 @@ Examples:
 
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "Always run checks instead of reusing filesystem check results "
+            f"from the last {CACHE_TTL_SECONDS:g}s (the git check always runs)"
+        ),
+    )
+
     args = parser.parse_args()
 
     # Parse check names
@@ -601,7 +816,11 @@ Examples:
     auditor = HealthAuditor(args.path, verbose=args.verbose)
 
     try:
-        auditor.run_checks(check_names=check_names, min_severity=min_severity)
+        auditor.run_checks(
+            check_names=check_names,
+            min_severity=min_severity,
+            cache_dir=None if args.no_cache else CACHE_DIR,
+        )
     except ValueError as e:
         parser.error(str(e))
 
@@ -613,7 +832,10 @@ Examples:
         if args.verbose:
             print(f"Report written to: {args.output}", file=sys.stderr)
     else:
-        print(json.dumps(report, indent=2))
+        # WHY: Encode straight into stdout's buffer instead of building the
+        # whole document as one string first
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
 
     # WHY: Exit with non-zero if any checks failed
     sys.exit(0 if report["failed"] == 0 else 1)
@@ -14,14 +14,36 @@ systems without parsing text output.
 """
 
 import argparse
+import importlib.util
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Any
+from typing import Any, Callable, Dict, List, Set
 
 SKILLS_DIR = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(SKILLS_DIR / "shared"))
-from cross_platform import atomic_write_json  # type: ignore[import-not-found]  # noqa: E402
+# WHY: Load cross_platform straight from its file instead of prepending to
+# sys.path, which would invalidate the path importer cache for every import
+_spec = importlib.util.spec_from_file_location(
+    "cross_platform", SKILLS_DIR / "shared" / "cross_platform.py"
+)
+assert _spec is not None and _spec.loader is not None
+cross_platform = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cross_platform)
+atomic_write_bytes = cross_platform.atomic_write_bytes
+
+# WHY: orjson serializes in C and is noticeably faster on large monorepo results;
+# fall back to the stdlib encoder when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize analysis results as indented, key-sorted UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
 
 
 class ProjectDetector:
@@ -180,6 +202,22 @@ class ProjectDetector:
 
         return subtypes
 
+    @staticmethod
+    def _dependency_checker(data: Dict[str, Any]) -> Callable[[str], bool]:
+        """
+        Build a membership test over package.json dependencies and devDependencies.
+
+        WHY: Checking both maps in place avoids copying them into a merged dict,
+        which is O(n) in the dependency count for every lookup site.
+        """
+        deps = data.get("dependencies") or ()
+        dev_deps = data.get("devDependencies") or ()
+
+        def has_dep(name: str) -> bool:
+            return name in deps or name in dev_deps
+
+        return has_dep
+
     def _detect_nodejs_subtypes(self) -> List[str]:
         """
         Detect Node.js subtypes from package.json.
@@ -207,17 +245,17 @@ class ProjectDetector:
                     subtypes.append("application")
 
             # WHY: Check dependencies for framework indicators
-            deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+            has_dep = self._dependency_checker(data)
 
-            if "react" in deps or "react-dom" in deps:
+            if has_dep("react") or has_dep("react-dom"):
                 if "react" not in subtypes:
                     subtypes.append("react")
 
-            if "next" in deps:
+            if has_dep("next"):
                 if "nextjs" not in subtypes:
                     subtypes.append("nextjs")
 
-            if "express" in deps:
+            if has_dep("express"):
                 if "express" not in subtypes:
                     subtypes.append("express")
 
@@ -304,24 +342,21 @@ class ProjectDetector:
             try:
                 data = json.loads(package_json.read_text(encoding="utf-8"))
 
-                deps = {
-                    **data.get("dependencies", {}),
-                    **data.get("devDependencies", {}),
-                }
+                has_dep = self._dependency_checker(data)
 
                 # WHY: Common test frameworks
-                if "vitest" in deps:
+                if has_dep("vitest"):
                     caps["test_framework"] = "vitest"
-                elif "jest" in deps:
+                elif has_dep("jest"):
                     caps["test_framework"] = "jest"
-                elif "mocha" in deps:
+                elif has_dep("mocha"):
                     caps["test_framework"] = "mocha"
 
                 # WHY: Common linters/formatters
-                if "eslint" in deps:
+                if has_dep("eslint"):
                     caps["linter"] = "eslint"
 
-                if "prettier" in deps:
+                if has_dep("prettier"):
                     caps["formatter"] = "prettier"
 
             except (json.JSONDecodeError, OSError) as e:
@@ -474,14 +509,14 @@ Examples:
     if args.output:
         # WHY: Write to file if specified
         try:
-            atomic_write_json(args.output, result)
+            atomic_write_bytes(args.output, _dumps(result))
             print(f"Analysis written to {args.output}", file=sys.stderr)
         except OSError as e:
             print(f"Error writing to {args.output}: {e}", file=sys.stderr)
             sys.exit(1)
     else:
         # WHY: Print to stdout for piping to other tools
-        print(json.dumps(result, indent=2))
+        sys.stdout.write(_dumps(result).decode("utf-8") + "\n")
 
 
 if __name__ == "__main__":
@@ -13,9 +13,10 @@ Exits with non-zero code if validation fails.
 
 import sys
 import re
+from bisect import bisect_left
 import argparse
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from dataclasses import dataclass, field
 
 SKILLS_DIR = Path(__file__).parent.parent.parent
@@ -27,6 +28,56 @@ from thresholds import (  # type: ignore[import-not-found]  # noqa: E402
     is_architecture_too_complex,
 )
 
+# WHY: Patterns are compiled once at import rather than looked up in the re
+# module cache (and its flags re-parsed) on every validator call
+_PHASE_RE = re.compile(r"^##\s+Phase\s+\d+[:\s]+(\w+)", re.MULTILINE | re.IGNORECASE)
+_COMPONENT_RE = re.compile(r"^###\s+Component[:\s]+(.+)", re.MULTILINE)
+# Only tried at line starts and component body starts, so it needs no ^
+_SUB_COMPONENT_RE = re.compile(r"####\s+")
+_COMPONENT_MARKER = "### Component"
+_RISK_SECTION_RE = re.compile(
+    r"##\s+(?:Phase\s+\d+[:\s]+)?Risk.*?\n(.*?)(?=\n##|\Z)", re.IGNORECASE | re.DOTALL
+)
+_RISK_ITEM_RE = re.compile(r"^[-*]\s+\[.\]\s+", re.MULTILINE)
+_TASK_RE = re.compile(
+    r"^[-*]\s+\[.\]\s+(.+?)(?:\s+\(depends on:?\s*(.+?)\))?$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_NON_ID_CHARS_RE = re.compile(r"[^a-z0-9]+")
+_DEP_SEPARATOR_RE = re.compile(r"[,;]")
+_CRITERIA_RE = re.compile(
+    r"(?:success criteria|acceptance criteria|done when)[:\s]*\n(.*?)(?=\n##|\n###|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+_CRITERIA_HEADINGS = ("success criteria", "acceptance criteria", "done when")
+
+_VAGUE_TERMS = (
+    "appropriate",
+    "sufficient",
+    "reasonable",
+    "adequate",
+    "good",
+    "proper",
+)
+# Measurable indicators stay separate patterns: each has a selective prefix the
+# regex engine scans for quickly, which a combined alternation would lose
+_MEASURABLE_RES = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"\d+%",  # Percentages
+        r"\d+\s*(hours?|days?|minutes?)",  # Time
+        r"exit code\s*\d+",  # Exit codes
+        r"at least\s+\d+",  # Minimums
+        r"no more than\s+\d+",  # Maximums
+    )
+)
+
+_REQUIRED_PHASES = frozenset(PLANNING.REQUIRED_PHASES)
+
+_METRIC_PHASE_RE = re.compile(r"^##\s+Phase", re.MULTILINE)
+_METRIC_TASK_RE = re.compile(r"^[-*]\s+\[.\]", re.MULTILINE)
+_METRIC_RISK_RE = re.compile(r"^[-*]\s+\[.\].*risk", re.MULTILINE | re.IGNORECASE)
+
 
 @dataclass
 class ValidationResult:
@@ -38,48 +89,197 @@ class ValidationResult:
     metrics: dict[str, Any] = field(default_factory=dict)
 
 
-def validate_phases(content: str) -> tuple[bool, list[str], list[str]]:
+@dataclass
+class PlanTokens:
+    """Line-start offsets of the plan lines each validator cares about."""
+
+    content: str
+    line_count: int = 0
+    h2_starts: list[int] = field(default_factory=list)
+    h3_starts: list[int] = field(default_factory=list)
+    h4_starts: list[int] = field(default_factory=list)
+    item_starts: list[int] = field(default_factory=list)
+
+
+def _tokenize(content: str) -> PlanTokens:
+    """Classify every line of the plan once by its leading characters."""
+    tokens = PlanTokens(content)
+    h2_append = tokens.h2_starts.append
+    h3_append = tokens.h3_starts.append
+    h4_append = tokens.h4_starts.append
+    item_append = tokens.item_starts.append
+
+    # WHY: Split on "\n" only, matching what ^ means for re.MULTILINE
+    lines = content.split("\n")
+    tokens.line_count = len(lines)
+    pos = 0
+    for line in lines:
+        first = line[:1]
+        if first == "#":
+            if line.startswith("####"):
+                h4_append(pos)
+            elif line.startswith("###"):
+                h3_append(pos)
+            elif line.startswith("##"):
+                h2_append(pos)
+        elif first == "-" or first == "*":
+            item_append(pos)
+        pos += len(line) + 1
+
+    return tokens
+
+
+def _match_lines(
+    pattern: re.Pattern[str], content: str, starts: list[int], endpos: int | None = None
+) -> Iterator[re.Match[str]]:
+    """Match a pattern at each candidate offset, like finditer would.
+
+    The offsets are ascending line starts (or other positions where a match
+    may begin). Matches never overlap: an offset swallowed by the previous
+    match (the patterns allow whitespace, including newlines) is skipped.
+    """
+    if endpos is None:
+        endpos = len(content)
+    last_end = 0
+    for pos in starts:
+        if pos < last_end:
+            continue
+        match = pattern.match(content, pos, endpos)
+        if match:
+            last_end = match.end()
+            yield match
+
+
+def _norm_id(name: str) -> str:
+    """Normalize a task name or dependency reference to a task ID."""
+    return _NON_ID_CHARS_RE.sub("-", name.lower())[:50]
+
+
+def _find_cycles(nodes: list[str], graph: dict[str, list[str]]) -> list[list[str]]:
+    """Return every dependency cycle as a strongly connected component.
+
+    Iterative Tarjan: one O(V+E) sweep with an explicit work stack, so long
+    dependency chains cannot hit the recursion limit. A component is a cycle
+    when it has more than one task or a task that depends on itself.
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    cycles: list[list[str]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    # Descend; this node's remaining successors resume later
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph.get(succ, ()))))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != index[node]:
+                    continue
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in graph.get(node, ()):
+                    cycles.append(component)
+
+    return cycles
+
+
+def _criteria_sections(content: str) -> Iterator[re.Match[str]]:
+    """Find the success criteria sections, like _CRITERIA_RE.finditer."""
+    if not content.isascii():
+        return _CRITERIA_RE.finditer(content)
+
+    # WHY: For ASCII text lowercasing keeps offsets and agrees with
+    # IGNORECASE, so str.find locates the headings and the regex only runs
+    # there instead of being tried at every position of the plan
+    lowered = content.lower()
+    starts = []
+    for heading in _CRITERIA_HEADINGS:
+        pos = lowered.find(heading)
+        while pos != -1:
+            starts.append(pos)
+            pos = lowered.find(heading, pos + 1)
+    starts.sort()
+    return _match_lines(_CRITERIA_RE, content, starts)
+
+
+def validate_phases(tokens: PlanTokens) -> tuple[bool, list[str], list[str]]:
     """Validate all required phases are present."""
     errors: list[str] = []
     warnings: list[str] = []
 
-    phase_pattern = r"^##\s+Phase\s+\d+[:\s]+(\w+)"
     found_phases = set()
 
-    for match in re.finditer(phase_pattern, content, re.MULTILINE | re.IGNORECASE):
+    for match in _match_lines(_PHASE_RE, tokens.content, tokens.h2_starts):
         phase_name = match.group(1).lower()
         found_phases.add(phase_name)
 
-    required = set(PLANNING.REQUIRED_PHASES)
-    missing = required - found_phases
+    missing = _REQUIRED_PHASES - found_phases
 
     if missing:
         errors.append(f"Missing required phases: {', '.join(missing)}")
 
-    extra = found_phases - required
+    extra = found_phases - _REQUIRED_PHASES
     if extra:
         warnings.append(f"Extra phases found: {', '.join(extra)}")
 
     return len(errors) == 0, errors, warnings
 
 
-def validate_architecture_complexity(content: str) -> tuple[bool, list[str], list[str]]:
+def validate_architecture_complexity(
+    tokens: PlanTokens,
+) -> tuple[bool, list[str], list[str]]:
     """Validate architecture doesn't exceed complexity thresholds."""
     errors: list[str] = []
     warnings: list[str] = []
 
     # Find component sections
-    component_pattern = r"^###\s+Component[:\s]+(.+)"
-    components = re.findall(component_pattern, content, re.MULTILINE)
-
-    top_level_count = len(components)
+    content = tokens.content
+    top_level_count = sum(
+        1 for _ in _match_lines(_COMPONENT_RE, content, tokens.h3_starts)
+    )
 
-    # Count sub-components per component
+    # Count sub-components per component. A component body runs from one
+    # marker to the next (as splitting on the marker would cut it), but is
+    # walked by offsets instead of being copied out of content
     max_sub = 0
-    sub_pattern = r"^####\s+"
-    sections = content.split("### Component")
-    for section in sections[1:]:  # Skip content before first component
-        sub_count = len(re.findall(sub_pattern, section, re.MULTILINE))
+    h4_starts = tokens.h4_starts
+    marker_start = content.find(_COMPONENT_MARKER)
+    while marker_start != -1:
+        body_start = marker_start + len(_COMPONENT_MARKER)
+        marker_start = content.find(_COMPONENT_MARKER, body_start)
+        body_end = len(content) if marker_start == -1 else marker_start
+        first = bisect_left(h4_starts, body_start)
+        last = bisect_left(h4_starts, body_end, first)
+        # The body start counts as a line start, as it did for a split piece
+        candidates = [body_start, *h4_starts[first:last]]
+        sub_count = sum(
+            1 for _ in _match_lines(_SUB_COMPONENT_RE, content, candidates, body_end)
+        )
         max_sub = max(max_sub, sub_count)
 
     if is_architecture_too_complex(top_level_count, max_sub):
@@ -97,17 +297,15 @@ def validate_architecture_complexity(content: str) -> tuple[bool, list[str], lis
     return len(errors) == 0, errors, warnings
 
 
-def validate_risk_coverage(content: str) -> tuple[bool, list[str], list[str]]:
+def validate_risk_coverage(tokens: PlanTokens) -> tuple[bool, list[str], list[str]]:
     """Validate risk assessment covers all categories."""
     errors: list[str] = []
     warnings: list[str] = []
 
     # Find risk section
-    risk_section_match = re.search(
-        r"##\s+(?:Phase\s+\d+[:\s]+)?Risk.*?\n(.*?)(?=\n##|\Z)",
-        content,
-        re.IGNORECASE | re.DOTALL,
-    )
+    # WHY: The risk heading is not anchored to a line start, so it is still
+    # found by one search rather than from the classified lines
+    risk_section_match = _RISK_SECTION_RE.search(tokens.content)
 
     if not risk_section_match:
         errors.append("No risk assessment section found")
@@ -115,122 +313,106 @@ def validate_risk_coverage(content: str) -> tuple[bool, list[str], list[str]]:
 
     risk_content = risk_section_match.group(1).lower()
 
-    # Check each category
+    # Check each category (plain substring tests on the lowered section
+    # outpace a combined regex here, see validate_success_criteria)
     for category in PLANNING.RISK_CATEGORIES:
         if category not in risk_content:
             warnings.append(f"Risk category not explicitly addressed: {category}")
 
-    # Count risks
-    risk_items = re.findall(r"^[-*]\s+\[.\]\s+", risk_content, re.MULTILINE)
+    # Count risks among the checkbox lines inside the section
+    section_start, section_end = risk_section_match.span(1)
+    item_starts = tokens.item_starts
+    first_item = bisect_left(item_starts, section_start)
+    last_item = bisect_left(item_starts, section_end, first_item)
+    risk_count = sum(
+        1
+        for _ in _match_lines(
+            _RISK_ITEM_RE,
+            tokens.content,
+            item_starts[first_item:last_item],
+            section_end,
+        )
+    )
 
     min_required = len(PLANNING.RISK_CATEGORIES) * PLANNING.MIN_RISKS_PER_CATEGORY
-    if len(risk_items) < min_required:
+    if risk_count < min_required:
         warnings.append(
-            f"Only {len(risk_items)} risks identified "
+            f"Only {risk_count} risks identified "
             f"(recommended minimum: {min_required})"
         )
 
     return len(errors) == 0, errors, warnings
 
 
-def validate_task_dependencies(content: str) -> tuple[bool, list[str], list[str]]:
+def validate_task_dependencies(
+    tokens: PlanTokens,
+) -> tuple[bool, list[str], list[str]]:
     """Validate task dependencies form a valid DAG."""
     errors: list[str] = []
     warnings: list[str] = []
 
     # Find tasks with dependencies
-    task_pattern = r"^[-*]\s+\[.\]\s+(.+?)(?:\s+\(depends on:?\s*(.+?)\))?$"
-    tasks = {}
-    dependencies = {}
+    tasks: dict[str, str] = {}
+    # Dependency references are normalized here, once per reference
+    dependencies: dict[str, list[str]] = {}
+    # Bound once; the check runs for every task that has dependencies
+    max_deps = TASK_COMPLEXITY.MAX_DEPENDENCIES_PER_TASK
 
-    for match in re.finditer(task_pattern, content, re.MULTILINE | re.IGNORECASE):
+    for match in _match_lines(_TASK_RE, tokens.content, tokens.item_starts):
         task_name = match.group(1).strip()
         deps = match.group(2)
 
         # Generate task ID
-        task_id = re.sub(r"[^a-z0-9]+", "-", task_name.lower())[:50]
+        task_id = _norm_id(task_name)
         tasks[task_id] = task_name
 
         if deps:
-            dep_list = [d.strip() for d in re.split(r"[,;]", deps)]
+            dep_list = [_norm_id(d.strip()) for d in _DEP_SEPARATOR_RE.split(deps)]
             dependencies[task_id] = dep_list
 
-            if len(dep_list) > TASK_COMPLEXITY.MAX_DEPENDENCIES_PER_TASK:
+            if len(dep_list) > max_deps:
                 warnings.append(
                     f"Task '{task_name}' has {len(dep_list)} dependencies "
-                    f"(max recommended: {TASK_COMPLEXITY.MAX_DEPENDENCIES_PER_TASK})"
+                    f"(max recommended: {max_deps})"
                 )
 
-    # Check for circular dependencies (simple DFS)
-    def has_cycle(node: str, visited: set[str], path: set[str]) -> bool:
-        if node in path:
-            return True
-        if node in visited:
-            return False
-
-        visited.add(node)
-        path.add(node)
-
-        for dep in dependencies.get(node, []):
-            # Normalize dependency reference
-            dep_id = re.sub(r"[^a-z0-9]+", "-", dep.lower())[:50]
-            if has_cycle(dep_id, visited, path):
-                return True
-
-        path.remove(node)
-        return False
-
-    visited: set[str] = set()
-    for task_id in tasks:
-        if has_cycle(task_id, visited, set()):
+    # Check for circular dependencies, reporting each cycle once
+    for cycle in _find_cycles(list(tasks), dependencies):
+        # Only tasks with dependencies can be on a cycle, so all are named
+        names = sorted(tasks[task_id] for task_id in cycle)
+        if len(names) == 1:
+            errors.append(f"Circular dependency detected involving task: {names[0]}")
+        else:
             errors.append(
-                f"Circular dependency detected involving task: {tasks[task_id]}"
+                f"Circular dependency detected involving tasks: {', '.join(names)}"
             )
-            break
 
     return len(errors) == 0, errors, warnings
 
 
-def validate_success_criteria(content: str) -> tuple[bool, list[str], list[str]]:
+def validate_success_criteria(
+    tokens: PlanTokens,
+) -> tuple[bool, list[str], list[str]]:
     """Validate success criteria are measurable."""
     errors: list[str] = []
     warnings: list[str] = []
+    content = tokens.content
 
     # Find success criteria sections
-    criteria_pattern = r"(?:success criteria|acceptance criteria|done when)[:\s]*\n(.*?)(?=\n##|\n###|\Z)"
-    matches = re.finditer(criteria_pattern, content, re.IGNORECASE | re.DOTALL)
-
-    vague_terms = [
-        "appropriate",
-        "sufficient",
-        "reasonable",
-        "adequate",
-        "good",
-        "proper",
-    ]
+    for match in _criteria_sections(content):
+        # WHY: Lowercase once per section; a substring test per term is
+        # several times faster than one alternation regex over the text
+        criteria_text = match.group(1).lower()
 
-    for match in matches:
-        criteria_text = match.group(1)
-
-        for term in vague_terms:
-            if term in criteria_text.lower():
+        for term in _VAGUE_TERMS:
+            if term in criteria_text:
                 warnings.append(
                     f"Vague term '{term}' found in success criteria. "
                     "Replace with measurable threshold."
                 )
 
     # Check for measurable indicators
-    measurable_patterns = [
-        r"\d+%",  # Percentages
-        r"\d+\s*(hours?|days?|minutes?)",  # Time
-        r"exit code\s*\d+",  # Exit codes
-        r"at least\s+\d+",  # Minimums
-        r"no more than\s+\d+",  # Maximums
-    ]
-
-    has_measurable = any(
-        re.search(p, content, re.IGNORECASE) for p in measurable_patterns
-    )
+    has_measurable = any(p.search(content) for p in _MEASURABLE_RES)
 
     if not has_measurable:
         warnings.append(
@@ -244,12 +426,21 @@ def validate_plan(plan_path: Path) -> ValidationResult:
     """Validate a plan file."""
     result = ValidationResult(valid=True)
 
-    if not plan_path.exists():
+    # WHY: One stat both checks existence and gives the size in bytes;
+    # len(content) counted decoded characters after newline translation
+    try:
+        size_bytes = plan_path.stat().st_size
+    except (FileNotFoundError, NotADirectoryError):
         result.valid = False
         result.errors.append(f"Plan file not found: {plan_path}")
         return result
 
+    # read_text keeps universal newlines, which the $ anchors rely on for
+    # plans saved with CRLF line endings
     content = plan_path.read_text(encoding="utf-8")
+    # WHY: One pass over the lines; validators then only visit the lines
+    # their patterns can match instead of each re-scanning all of content
+    tokens = _tokenize(content)
 
     # Run all validations
     validations = [
@@ -261,7 +452,7 @@ def validate_plan(plan_path: Path) -> ValidationResult:
     ]
 
     for name, validator in validations:
-        valid, errors, warnings = validator(content)
+        valid, errors, warnings = validator(tokens)
 
         if not valid:
             result.valid = False
@@ -272,12 +463,16 @@ def validate_plan(plan_path: Path) -> ValidationResult:
     # Collect metrics
     result.metrics = {
         "file": str(plan_path),
-        "size_bytes": len(content),
-        "lines": content.count("\n") + 1,
-        "phases_found": len(re.findall(r"^##\s+Phase", content, re.MULTILINE)),
-        "tasks_found": len(re.findall(r"^[-*]\s+\[.\]", content, re.MULTILINE)),
-        "risks_found": len(
-            re.findall(r"^[-*]\s+\[.\].*risk", content, re.MULTILINE | re.IGNORECASE)
+        "size_bytes": size_bytes,
+        "lines": tokens.line_count,
+        "phases_found": sum(
+            1 for _ in _match_lines(_METRIC_PHASE_RE, content, tokens.h2_starts)
+        ),
+        "tasks_found": sum(
+            1 for _ in _match_lines(_METRIC_TASK_RE, content, tokens.item_starts)
+        ),
+        "risks_found": sum(
+            1 for _ in _match_lines(_METRIC_RISK_RE, content, tokens.item_starts)
         ),
     }
 
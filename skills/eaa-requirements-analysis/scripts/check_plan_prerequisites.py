@@ -65,36 +65,45 @@ def check_prerequisites(show_fixes: bool = False) -> tuple[list, list]:
         failed.append((f"Requirements file missing: {req_file}", f"Create {req_file}"))
 
     # Check 3: All requirement sections complete
-    sections = data.get("requirements_sections", [])
-    for section in sections:
-        name = section.get("name", "Unknown")
-        status = section.get("status", "pending")
-        if status == "complete":
-            passed.append(f"Requirement section complete: {name}")
-        else:
-            failed.append(
-                (f"Requirement section incomplete: {name} ({status})",
-                 f"/modify-requirement requirement \"{name}\" --status complete")
-            )
+    section_states = [
+        (section.get("name", "Unknown"), section.get("status", "pending"))
+        for section in data.get("requirements_sections") or ()
+    ]
+    passed.extend(
+        f"Requirement section complete: {name}"
+        for name, status in section_states
+        if status == "complete"
+    )
+    failed.extend(
+        (f"Requirement section incomplete: {name} ({status})",
+         f"/modify-requirement requirement \"{name}\" --status complete")
+        for name, status in section_states
+        if status != "complete"
+    )
 
     # Check 4: Modules defined
-    modules = data.get("modules", [])
+    modules = data.get("modules") or ()
     if modules:
         passed.append(f"Modules defined: {len(modules)}")
     else:
         failed.append(("No modules defined", "/add-requirement module \"name\" --criteria \"criteria\""))
 
     # Check 5: All modules have acceptance criteria
-    for module in modules:
-        mod_id = module.get("id", "unknown")
-        criteria = module.get("acceptance_criteria")
-        if criteria:
-            passed.append(f"Module has criteria: {mod_id}")
-        else:
-            failed.append(
-                (f"Module missing criteria: {mod_id}",
-                 f"/modify-requirement module {mod_id} --criteria \"criteria\"")
-            )
+    module_states = [
+        (module.get("id", "unknown"), bool(module.get("acceptance_criteria")))
+        for module in modules
+    ]
+    passed.extend(
+        f"Module has criteria: {mod_id}"
+        for mod_id, has_criteria in module_states
+        if has_criteria
+    )
+    failed.extend(
+        (f"Module missing criteria: {mod_id}",
+         f"/modify-requirement module {mod_id} --criteria \"criteria\"")
+        for mod_id, has_criteria in module_states
+        if not has_criteria
+    )
 
     # Check 6: Not already approved
     if data.get("plan_phase_complete"):
@@ -5,8 +5,6 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-import yaml
-
 PLAN_STATE_FILE = Path(".claude/orchestrator-plan-phase.local.md")
 
 
@@ -24,8 +22,14 @@ def parse_frontmatter(file_path: Path) -> dict:
         return {}
 
     yaml_content = content[3:end_index].strip()
+
+    # Imported here so the "not in plan phase" exit and --help skip PyYAML;
+    # the libyaml CSafeLoader is used when PyYAML was built with it
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        return yaml.safe_load(yaml_content) or {}
+        return yaml.load(yaml_content, Loader=loader) or {}
     except yaml.YAMLError:
         return {}
 
@@ -95,14 +99,24 @@ def generate_summary(data: dict) -> str:
 
     req_file_exists = Path(data.get("requirements_file", "USER_REQUIREMENTS.md")).exists()
     all_req_complete = all(s.get("status") == "complete" for s in sections) if sections else False
-    all_modules_have_criteria = all(m.get("acceptance_criteria") for m in modules) if modules else False
     has_modules = len(modules) > 0
     plan_complete = data.get("plan_phase_complete", False)
 
+    # WHY: Both module checks share one walk over modules, which stops as
+    # soon as neither can still hold
+    all_modules_have_criteria = all_modules_have_issues = has_modules
+    for m in modules:
+        if not m.get("acceptance_criteria"):
+            all_modules_have_criteria = False
+        if not m.get("github_issue"):
+            all_modules_have_issues = False
+        if not (all_modules_have_criteria or all_modules_have_issues):
+            break
+
     criteria_status = [
         ("USER_REQUIREMENTS.md complete", req_file_exists and all_req_complete),
         ("All modules defined with acceptance criteria", has_modules and all_modules_have_criteria),
-        ("GitHub Issues created for all modules", all(m.get("github_issue") for m in modules) if modules else False),
+        ("GitHub Issues created for all modules", all_modules_have_issues),
         ("User approved the plan", plan_complete),
     ]
 
@@ -8,60 +8,132 @@ Use with caution - this will lose all planning progress.
 Usage:
     python3 reset_plan_phase.py --confirm
     python3 reset_plan_phase.py --confirm --no-backup
+    python3 reset_plan_phase.py --confirm --no-fsync
 """
 
 import argparse
+import errno
+import functools
+import os
 import shutil
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
 PLAN_STATE_FILE = Path(".claude/orchestrator-plan-phase.local.md")
 BACKUP_DIR = Path("docs_dev/plan_backups")
 
 
-def backup_state_file() -> Path | None:
-    """Create a backup of the current state file."""
-    if not PLAN_STATE_FILE.exists():
-        return None
+def _fsync_dir(directory: Path) -> None:
+    """Flush directory entry changes (create/rename) in a directory to disk."""
+    # WHY: Windows cannot open a directory for fsync; NTFS journals renames itself
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
-    # Ensure backup directory exists
-    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 
+def _move_state_file(backup_path: Path, fsync: bool) -> None:
+    """Move the state file to backup_path, copying only across filesystems."""
+    # WHY: A rename moves the file aside in one syscall without copying its bytes;
+    # only fall back to copy + unlink when the backup dir is on another filesystem
+    try:
+        os.replace(PLAN_STATE_FILE, backup_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # WHY: copyfile uses the platform's in-kernel copy (sendfile/fcopyfile), so
+        # the bytes never pass through a user-space buffer; copystat is skipped
+        # because a timestamped backup has no use for the original metadata
+        shutil.copyfile(PLAN_STATE_FILE, backup_path)
+        if fsync:
+            fd = os.open(backup_path, os.O_WRONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        PLAN_STATE_FILE.unlink(missing_ok=True)
+
+
+def backup_state_file(fsync: bool = True) -> tuple[Path | None, list[str]]:
+    """Move the current state file into a timestamped backup.
+
+    Returns (backup path, warnings); the path is None when there is no state
+    file to back up. With fsync enabled the backup is flushed to disk (file
+    data on the copy fallback, plus a single fsync of the backup directory)
+    before returning, so a crash cannot leave a missing or empty backup
+    behind. The directory fsync is best-effort: the move has already
+    happened, so a failure there is only reported as a warning.
+    """
     # Generate backup filename with timestamp
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    timestamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
     backup_path = BACKUP_DIR / f"plan-phase-backup-{timestamp}.md"
 
-    shutil.copy2(PLAN_STATE_FILE, backup_path)
-    return backup_path
-
-
-def reset_plan_phase(create_backup: bool = True) -> bool:
-    """Reset the plan phase by removing the state file."""
-    if not PLAN_STATE_FILE.exists():
-        print("No plan phase state file found. Nothing to reset.")
-        return True
-
-    # Create backup if requested
+    # WHY: Attempt the move first instead of stat-ing the state file; ENOENT
+    # means either no state file or no backup dir, and only the latter is
+    # worth creating the directory and retrying for
+    try:
+        _move_state_file(backup_path, fsync)
+    except FileNotFoundError:
+        if not PLAN_STATE_FILE.exists():
+            return None, []
+        BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+        _move_state_file(backup_path, fsync)
+
+    warnings: list[str] = []
+    if fsync:
+        # WHY: Some filesystems (e.g. NFS/SMB mounts) reject fsync on a
+        # directory with EINVAL/ENOTSUP/EBADF; the backup itself is in place
+        try:
+            _fsync_dir(BACKUP_DIR)
+        except OSError as e:
+            warnings.append(f"WARNING: Could not flush backup directory to disk: {e}")
+    return backup_path, warnings
+
+
+def reset_plan_phase(
+    create_backup: bool = True, fsync: bool = True
+) -> tuple[bool, list[str]]:
+    """Reset the plan phase by removing the state file.
+
+    Returns (success, status lines); the caller decides how to print them.
+    """
+    # Remove the state file, moving it into a backup if requested
     backup_path = None
-    if create_backup:
-        backup_path = backup_state_file()
-        if backup_path:
-            print(f"Backup created: {backup_path}")
-
-    # Remove the state file
+    warnings: list[str] = []
     try:
-        PLAN_STATE_FILE.unlink()
-        print(f"Removed: {PLAN_STATE_FILE}")
-        print("\nPlan phase has been reset.")
-        print("Run /start-planning to begin a new plan.")
-        return True
+        if create_backup:
+            backup_path, warnings = backup_state_file(fsync=fsync)
+            removed = backup_path is not None
+        else:
+            PLAN_STATE_FILE.unlink()
+            removed = True
+    except FileNotFoundError:
+        # WHY: The file vanishing mid-reset is a no-op, not an error
+        removed = False
     except Exception as e:
-        print(f"ERROR: Failed to remove state file: {e}")
-        return False
+        return False, [f"ERROR: Failed to remove state file: {e}"]
 
+    if not removed:
+        return True, ["No plan phase state file found. Nothing to reset."]
 
-def main() -> int:
+    lines = [f"Backup created: {backup_path}"] if backup_path else []
+    lines += warnings
+    lines += [
+        f"Removed: {PLAN_STATE_FILE}",
+        "",
+        "Plan phase has been reset.",
+        "Run /start-planning to begin a new plan.",
+    ]
+    return True, lines
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once and reuse it across main() calls."""
     parser = argparse.ArgumentParser(description="Reset plan phase")
     parser.add_argument(
         "--confirm",
@@ -74,19 +146,34 @@ def main() -> int:
         action="store_true",
         help="Skip backup creation"
     )
+    parser.add_argument(
+        "--no-fsync",
+        action="store_true",
+        help="Skip flushing the backup to disk (e.g. on SMB/NFS without fsync support)"
+    )
+    return parser
 
-    args = parser.parse_args()
+
+def main() -> int:
+    args = _build_parser().parse_args()
 
     if not args.confirm:
-        print("ERROR: Must provide --confirm flag to proceed")
-        print("This operation will remove all planning progress.")
+        sys.stdout.write(
+            "ERROR: Must provide --confirm flag to proceed\n"
+            "This operation will remove all planning progress.\n"
+        )
         return 1
 
-    print("WARNING: This will reset the plan phase!")
-    print("All planning progress will be lost.")
-    print()
-
-    success = reset_plan_phase(create_backup=not args.no_backup)
+    success, lines = reset_plan_phase(
+        create_backup=not args.no_backup, fsync=not args.no_fsync
+    )
+    # WHY: Emit all status text with a single write instead of one print per line
+    sys.stdout.write("\n".join([
+        "WARNING: This will reset the plan phase!",
+        "All planning progress will be lost.",
+        "",
+        *lines,
+    ]) + "\n")
     return 0 if success else 1
 
 